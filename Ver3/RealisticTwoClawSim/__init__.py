@@ -14,7 +14,7 @@ This package contains:
 from . import config
 from .scanner import DScanner
 from .endBox import Box
-from .crane import Crane, BlueCrane, RedCrane
+from .crane import Crane, BlueCrane, RedCrane, CraneState
 from .display import SimulationDisplay, display_simulation
 from .simulation import SimulationController, run_simulation
 
@@ -26,6 +26,7 @@ __all__ = [
     'Crane',
     'BlueCrane',
     'RedCrane',
+    'CraneState',
     'SimulationDisplay',
     'display_simulation',
     'SimulationController',
@@ -87,6 +87,21 @@ FPS = 60
 DT = 1.0 / FPS
 SIM_SPEED_MULTIPLIER = 1.0
 
+# Physics steps advanced per rendered animation frame. Only the last step of
+# each frame updates any artists (cranes, labels, metrics, side view), so
+# raising this speeds playback up without coarsening the timestep like the
+# multiplier does. Clock and metrics are the same as stepping one at a time.
+DISP_SKIP = 1
+
+# Verbose crane state-machine logging (collisions, yielding, transitions).
+# Off by default: formatting and printing these messages every frame costs
+# far more than the simulation math itself.
+DEBUG_CRANE = False
+
+# Crane artists are only moved once the crane has travelled at least this far
+# since the last draw (0.5mm is well below one pixel at the default figure size)
+REDRAW_THRESHOLD_MM = 0.5
+
 # ============================================================================
 # MOVEMENT DYNAMICS (in mm/s and mm/s²)
 # ============================================================================
@@ -5,11 +5,22 @@ Supports 2D movement (x, y axes can move simultaneously)
 Z-axis (vertical) movement is separate and cannot occur during x/y movement
 """
 
+import functools
 import math
+from enum import IntEnum
+
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle, RegularPolygon
 
 from . import config
+from . import kinematics
+from .scanner import DScanner
+
+# Transitions start and end on a handful of fixed points (home, pickup, scanner
+# drop zones, boxes), so the same exact endpoint pairs are solved over and over.
+# Only Crane.travel_time_2d goes through this cache; the yield path starts from
+# one-off mid-move positions and calls the kernel directly.
+_cached_travel_time_2d = functools.lru_cache(maxsize=256)(kinematics.travel_time_2d)
 
 
 def make_diamond(x, y, color, size=0.18, z=6):
@@ -20,6 +31,66 @@ def make_diamond(x, y, color, size=0.18, z=6):
     )
 
 
+class CraneState(IntEnum):
+    """
+    States of the crane state machines
+
+    Both cranes share one enum so each crane can inspect the other's state
+    (coordination, deadlock detection) with plain integer comparisons.
+    """
+    WAIT = 0
+
+    # Blue crane: START -> scanner loading cycle
+    MOVE_TO_START = 1
+    PICK_AT_START = 2
+    MOVE_TO_SCANNER = 3  # Also used by red crane
+    DROP_AT_SCANNER = 4
+    RETURN_TO_START = 5
+    MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD = 6
+    RETURN_TO_HOME_WITH_DIAMOND = 7
+    WAIT_AT_HOME = 8
+    MOVE_TO_HOME_EMPTY = 9
+
+    # Red crane: scanner -> end box delivery cycle
+    LOWER_FOR_PICKUP = 10
+    PICK_AT_SCANNER = 11
+    MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP = 12
+    WAIT_FOR_BLUE_TO_LOAD_RIGHT = 13
+    MOVE_TO_BOX = 14  # RedCrane._post_drop_action is set when the move starts
+    DROP_AT_BOX = 15  # Next move chosen by RedCrane._post_drop_action
+    RETURN_HOME = 16
+
+
+# States in which a crane is travelling along the rail (deadlock detection)
+_MOVEMENT_STATES = frozenset((
+    CraneState.MOVE_TO_SCANNER, CraneState.MOVE_TO_BOX, CraneState.RETURN_HOME,
+    CraneState.MOVE_TO_START, CraneState.RETURN_TO_START, CraneState.RETURN_TO_HOME_WITH_DIAMOND,
+    CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP, CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD,
+    CraneState.MOVE_TO_HOME_EMPTY,
+))
+
+# Blue crane states that count as active loading work (red must always yield)
+_BLUE_WORKING_STATES = frozenset((
+    CraneState.PICK_AT_START,               # Blue picking up diamond
+    CraneState.DROP_AT_SCANNER,             # Blue loading scanner
+    CraneState.MOVE_TO_SCANNER,             # Blue going to load
+    CraneState.RETURN_TO_START,             # Blue returning after loading
+    CraneState.RETURN_TO_HOME_WITH_DIAMOND, # Blue returning home with diamond
+))
+
+# Blue crane states that leave the right side clear for the waiting red crane,
+# as a bitmask over state values: test with (1 << state) & mask
+_BLUE_CLEAR_OF_RIGHT_MASK = (
+    (1 << CraneState.WAIT_AT_HOME) | (1 << CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD) |
+    (1 << CraneState.WAIT) | (1 << CraneState.MOVE_TO_HOME_EMPTY)
+)
+
+# Red crane states in which it is holding off the right scanner for blue to reload it
+_RED_WAITING_FOR_RIGHT_LOAD_MASK = (
+    (1 << CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP) | (1 << CraneState.WAIT_FOR_BLUE_TO_LOAD_RIGHT)
+)
+
+
 class Crane:
     """
     Base Crane class with 2D movement support
@@ -32,13 +103,41 @@ class Crane:
     at any (x, y) coordinate within the workspace.
     """
 
+    # Scanner indices with special two-crane coordination rules
+    LEFT_SCANNER = 0
+    RIGHT_SCANNER = 1
+    RIGHT_SCANNER_MASK = 1 << RIGHT_SCANNER  # Bit in BlueCrane.scanners_loaded_mask
+
+    # Fixed attribute layout: cranes are read and written every frame
+    __slots__ = (
+        'ax', 'color', 'scanner_list',
+        # Position, geometry and limits
+        'x', 'y', 'z', 'initial_x', 'initial_y', 'crane_width', 'crane_height',
+        'rail_y', 'top_y', 'safe_distance', '_pickup_x', '_pickup_y',
+        'vmax_x', 'a_x', 'vmax_y', 'a_y', 'vmax_z', 'a_z',
+        'lower_time', 'raise_time', '_rail_minus_top', '_inv_lower', '_inv_raise',
+        # State machine
+        'state', 'action_timer', 'has_diamond', 'target_i', 'pick_phase', 'drop_phase',
+        'time_under_scanner', 'departure_time', 't_elapsed', '_move_specs', '_handlers',
+        '_scanner_changes_seen',
+        # Movement tracking
+        '_target_x', '_target_y', '_target_state',
+        '_move_start_x', '_move_start_y', '_move_dx', '_move_dy', '_move_inv_total_time',
+        '_move_active',
+        '_yield_key', '_yield_travel_time',
+        # Graphics
+        'crane_rect', 'diamond', '_drawn_x', '_drawn_y', '_diamond_drawn_x', '_redraw_threshold',
+        '_display_scale', '_display_carry_y', '_display_half_w', '_display_half_h',
+        'visual_enabled',
+    )
+
     def __init__(self, ax, color, initial_x, initial_y, crane_width=None, crane_height=None,
                  rail_y=None, top_y=None, safe_distance=None):
         """
         Initialize crane
 
         Args:
-            ax: Matplotlib axes
+            ax: Matplotlib axes (None for a headless crane that draws nothing)
             color: Color for crane visualization
             initial_x: Starting X position in mm
             initial_y: Starting Y position in mm (typically RAIL_Y)
@@ -76,6 +175,9 @@ class Crane:
         self.top_y = top_y  # Height when picking/dropping
         self.safe_distance = safe_distance
 
+        # Pickup zone is static configuration - look it up once
+        self._pickup_x, self._pickup_y = config.get_pickup_position()
+
         # Movement parameters from config
         self.vmax_x = config.VMAX_CLAW_X
         self.a_x = config.A_CLAW_X
@@ -85,150 +187,190 @@ class Crane:
         self.a_z = config.A_CLAW_Z
         self.lower_time = config.T_Z  # Time to lower/raise
         self.raise_time = config.T_Z
+        # Constants for the per-tick hoist animation
+        self._rail_minus_top = self.rail_y - self.top_y
+        self._inv_lower = 1.0 / self.lower_time
+        self._inv_raise = 1.0 / self.raise_time
 
         # State variables
-        self.state = "WAIT"
+        self.state = CraneState.WAIT
         self.action_timer = 0.0
         self.has_diamond = False
         self.target_i = None
         self.departure_time = float('inf')
         self.time_under_scanner = 0.0
         self.t_elapsed = 0.0  # Current simulation time
+        # DScanner.state_changes value at the last idle scanner check (-1 = none)
+        self._scanner_changes_seen = -1
 
         # Phase tracking for animations
         self.pick_phase = None  # "LOWER" or "RAISE"
         self.drop_phase = None  # "LOWER" or "RAISE"
 
+        # Linear movement states: {state: (target_fn, yield_check, on_arrive)}
+        # Filled in by subclasses and driven by _step_move()
+        self._move_specs = {}
+
+        # State dispatch table: handler(dt, other_crane) indexed by CraneState
+        # Filled in by subclasses (see _build_handler_table), used by step()
+        self._handlers = []
+
+        # Target of the current move, cached on entry to a movement state
+        # (valid only while _target_state matches self.state)
+        self._target_x = 0.0
+        self._target_y = 0.0
+        self._target_state = None
+
+        # Movement interpolation tracking (valid only while _move_active is True)
+        self._move_start_x = 0.0
+        self._move_start_y = 0.0
+        self._move_dx = 0.0
+        self._move_dy = 0.0
+        self._move_inv_total_time = 0.0
+        self._move_active = False
+
+        # Travel time computed by the last yield, keyed by (x, y, target_x, target_y)
+        self._yield_key = None
+        self._yield_travel_time = 0.0
+
+        # Artist updates are off for a headless crane (ax=None) and can be
+        # suspended while fast-forwarding (skip_to_time)
+        self.visual_enabled = ax is not None
+        # Last position pushed to the artists (see update_position)
+        self._drawn_x = self.x
+        self._drawn_y = self.y
+        self._redraw_threshold = config.REDRAW_THRESHOLD_MM
+        self._diamond_drawn_x = self.x
+
         # Visual elements (convert mm to display units)
         display_x = config.mm_to_display(self.x)
         display_y = config.mm_to_display(self.y)
         display_width = config.mm_to_display(crane_width)
         display_height = config.mm_to_display(crane_height)
 
-        self.crane_rect = Rectangle(
-            (display_x - display_width/2, display_y - display_height/2),
-            display_width, display_height,
-            fc=color, ec='black', lw=1.5, zorder=5
-        )
-        ax.add_patch(self.crane_rect)
+        # A headless crane (ax=None) builds no artists at all
+        self.crane_rect = None
+        if ax is not None:
+            self.crane_rect = Rectangle(
+                (display_x - display_width/2, display_y - display_height/2),
+                display_width, display_height,
+                fc=color, ec='black', lw=1.5, zorder=5
+            )
+            ax.add_patch(self.crane_rect)
 
         # No hoist visualization in top-down view
         # Side view will handle vertical movement visualization
 
-        # Diamond carried by this crane
+        # mm_to_display is a pure scale: keep the factor for per-frame redraws
+        self._display_scale = config.mm_to_display(1.0)
+        self._display_half_w = display_width / 2
+        self._display_half_h = display_height / 2
+
+        # Diamond carried by this crane (always drawn at top_y height)
         display_carry_y = config.mm_to_display(self.top_y)
-        self.diamond = make_diamond(display_x, display_carry_y, self.get_diamond_color())
-        self.diamond.set_visible(False)
-        ax.add_patch(self.diamond)
+        self._display_carry_y = display_carry_y
+        self.diamond = None
+        if ax is not None:
+            self.diamond = make_diamond(display_x, display_carry_y, self.get_diamond_color())
+            self.set_diamond_visible(False)
+            ax.add_patch(self.diamond)
 
     def get_diamond_color(self):
         """Override in subclasses for different diamond colors"""
         return '#66bb6a'
 
-    def update_position(self):
-        """Update visual position of crane"""
-        display_x = config.mm_to_display(self.x)
-        display_y = config.mm_to_display(self.y)
-        display_width = config.mm_to_display(self.crane_width)
-        display_height = config.mm_to_display(self.crane_height)
+    def update_position(self, force=False):
+        """
+        Update visual position of crane
 
-        self.crane_rect.set_xy((display_x - display_width/2, display_y - display_height/2))
+        Movements smaller than config.REDRAW_THRESHOLD_MM since the last draw
+        are sub-pixel, so the artist is left untouched unless force=True.
+        Nothing is drawn while visual_enabled is False.
 
-    def update_rendering(self, other_crane):
+        Args:
+            force: Always update the artist (use when snapping onto a target)
+        """
+        if not self.visual_enabled:
+            return
+        if not force and (abs(self.x - self._drawn_x) + abs(self.y - self._drawn_y)
+                          < self._redraw_threshold):
+            return
+        self._drawn_x = self.x
+        self._drawn_y = self.y
+
+        scale = self._display_scale
+        self.crane_rect.set_xy((self.x * scale - self._display_half_w,
+                                self.y * scale - self._display_half_h))
+
+    def set_diamond_visible(self, show):
         """
-        Update visual rendering to prevent cranes from appearing to overlap
+        Show or hide the carried diamond (no-op for a headless crane)
 
-        Strategy:
-        1. Adjust zorder so moving crane renders in front
-        2. Add slight Y-offset when cranes are close for visual separation
+        Visibility follows has_diamond even while visual_enabled is off during
+        skip_to_time, so this checks for the artist rather than the flag.
 
         Args:
-            other_crane: The other crane to check position against
+            show: True while the crane carries a diamond
         """
-        # Calculate distance
-        distance = abs(self.x - other_crane.x)
-
-        # Base zorder for cranes
-        base_zorder = 5
-
-        # Determine which crane should render in front based on state priority
-        movement_states = [
-            "MOVE_TO_SCANNER", "MOVE_TO_BOX", "RETURN_HOME",
-            "MOVE_TO_START", "RETURN_TO_START", "RETURN_TO_HOME_WITH_DIAMOND",
-            "MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP", "MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD",
-            "MOVE_TO_BOX_THEN_RIGHT_SCANNER", "MOVE_TO_HOME_EMPTY"
-        ]
-
-        # Check if cranes are close enough to need visual adjustment
-        if distance < self.safe_distance * 1.5:  # Within 1.5x safe distance
-            # Determine rendering priority
-            self_moving = self.state in movement_states
-            other_moving = other_crane.state in movement_states
-
-            # Rendering priority rules:
-            # 1. Moving crane in front of stationary crane
-            # 2. If both moving or both stationary: use crane priority
-            # 3. Crane with priority renders in front
-
-            if self_moving and not other_moving:
-                # This crane is moving, render in front
-                my_zorder = base_zorder + 2
-                other_zorder = base_zorder
-            elif other_moving and not self_moving:
-                # Other crane is moving, render in back
-                my_zorder = base_zorder
-                other_zorder = base_zorder + 2
-            else:
-                # Both moving or both stationary - use priority system
-                if self.has_priority_over(other_crane):
-                    my_zorder = base_zorder + 2
-                    other_zorder = base_zorder
-                else:
-                    my_zorder = base_zorder
-                    other_zorder = base_zorder + 2
-
-            # Update zorder
-            self.crane_rect.set_zorder(my_zorder)
-            other_crane.crane_rect.set_zorder(other_zorder)
-
-            # Add visual Y-offset for additional separation when very close
-            if distance < self.safe_distance:
-                # Apply small Y offset based on X position
-                # Crane on left gets slight downward offset, crane on right gets upward offset
-                if self.x < other_crane.x:
-                    # This crane is on left - shift down slightly
-                    y_offset = -3  # Small offset in mm
-                    other_y_offset = 3
-                else:
-                    # This crane is on right - shift up slightly
-                    y_offset = 3
-                    other_y_offset = -3
-
-                # Apply offset to visual position
-                display_x = config.mm_to_display(self.x)
-                display_y = config.mm_to_display(self.y + y_offset)
-                display_width = config.mm_to_display(self.crane_width)
-                display_height = config.mm_to_display(self.crane_height)
-                self.crane_rect.set_xy((display_x - display_width/2, display_y - display_height/2))
-
-                # Apply offset to other crane
-                other_display_x = config.mm_to_display(other_crane.x)
-                other_display_y = config.mm_to_display(other_crane.y + other_y_offset)
-                other_display_width = config.mm_to_display(other_crane.crane_width)
-                other_display_height = config.mm_to_display(other_crane.crane_height)
-                other_crane.crane_rect.set_xy((other_display_x - other_display_width/2,
-                                               other_display_y - other_display_height/2))
+        if self.diamond is not None:
+            self.diamond.set_visible(show)
+
+    def update_carried_diamond(self, force=False):
+        """
+        Move the carried diamond with the crane
+
+        Like update_position, moves smaller than config.REDRAW_THRESHOLD_MM
+        since the last draw are skipped; arrival snaps it exactly.
+
+        Args:
+            force: Always update the artist (use when snapping onto a target)
+        """
+        if not self.visual_enabled:
+            return
+        if not force and abs(self.x - self._diamond_drawn_x) < self._redraw_threshold:
+            return
+        self._diamond_drawn_x = self.x
+        self.diamond.xy = (self.x * self._display_scale, self._display_carry_y)
+
+    def _animate_hoist(self, inv_total, rising):
+        """
+        Show the hoist mid LOWER/RAISE phase from the remaining action time
+
+        Args:
+            inv_total: 1 / duration of the phase (self._inv_lower or self._inv_raise)
+            rising: True while raising, False while lowering
+        """
+        if rising:
+            prog = self.action_timer * inv_total
         else:
-            # Cranes far apart - reset to normal rendering
-            self.crane_rect.set_zorder(base_zorder)
-            other_crane.crane_rect.set_zorder(base_zorder)
+            prog = 1.0 - self.action_timer * inv_total
+        z = self.rail_y - self._rail_minus_top * prog
+        self.set_hoist(self.x, self.y, z, True)
 
-            # Reset positions (remove any Y-offset)
-            display_x = config.mm_to_display(self.x)
-            display_y = config.mm_to_display(self.y)
-            display_width = config.mm_to_display(self.crane_width)
-            display_height = config.mm_to_display(self.crane_height)
-            self.crane_rect.set_xy((display_x - display_width/2, display_y - display_height/2))
+    def _tick_lift(self, phase):
+        """
+        Advance one frame of a two-phase LOWER/RAISE hoist cycle
+
+        Shared by every pick and drop; the caller owns the phase attribute
+        and does the hand-off (take or release the diamond) itself.
+
+        Args:
+            phase: Current phase ("LOWER", "RAISE" or None)
+
+        Returns: "CONTACT" when lowering just finished (raise timer armed),
+                 "DONE" when raising just finished (hoist stowed), else None
+        """
+        if phase == "LOWER":
+            self._animate_hoist(self._inv_lower, rising=False)
+            if self.action_timer <= 0:
+                self.action_timer = self.raise_time
+                return "CONTACT"
+        elif phase == "RAISE":
+            self._animate_hoist(self._inv_raise, rising=True)
+            if self.action_timer <= 0:
+                self.set_hoist(self.x, self.y, self.top_y, False)
+                return "DONE"
+        return None
 
     def set_hoist(self, x, y, z_top, show):
         """Dummy method - hoist visualization removed from top-down view"""
@@ -237,38 +379,36 @@ class Crane:
     def travel_time_2d(self, x0, y0, x1, y1):
         """
         Calculate time to travel from (x0, y0) to (x1, y1)
-        Both axes can move simultaneously
+        Both axes can move simultaneously. Memoized: use for transitions whose
+        endpoints are fixed points, not for positions mid-move
 
         Returns: time in seconds
         """
-        return config.calculate_2d_travel_time(x0, y0, x1, y1)
+        return _cached_travel_time_2d(x0, y0, x1, y1,
+                                      self.vmax_x, self.a_x, self.vmax_y, self.a_y)
 
-    def would_collide_with(self, other_crane, safe_distance=None):
+    def would_collide_with(self, other_crane):
         """
         Check if this crane would collide with another crane
         Uses X-axis distance only since both cranes are on the same rail
 
         Args:
             other_crane: Another Crane object
-            safe_distance: Minimum safe distance in mm (default: self.safe_distance)
 
         Returns: Boolean
         """
-        if safe_distance is None:
-            safe_distance = self.safe_distance
-
         # Only check X-axis distance since they're both on the same rail
         distance_x = abs(self.x - other_crane.x)
 
-        collision = distance_x < safe_distance
+        collision = distance_x < self.safe_distance
 
         # DIAGNOSTIC: Log collision checks
-        if collision:
+        if collision and config.DEBUG_CRANE:
             print(f"⚠️  COLLISION DETECTED:")
-            print(f"   {self.color} crane at X={self.x:.1f}mm, state={self.state}, has_diamond={self.has_diamond}")
-            print(f"   {other_crane.color} crane at X={other_crane.x:.1f}mm, state={other_crane.state}, has_diamond={other_crane.has_diamond}")
-            print(f"   Distance: {distance_x:.1f}mm < {safe_distance:.1f}mm (COLLISION)")
-            print(f"   Time: {getattr(self, 't_elapsed', 0):.2f}s")
+            print(f"   {self.color} crane at X={self.x:.1f}mm, state={self.state.name}, has_diamond={self.has_diamond}")
+            print(f"   {other_crane.color} crane at X={other_crane.x:.1f}mm, state={other_crane.state.name}, has_diamond={other_crane.has_diamond}")
+            print(f"   Distance: {distance_x:.1f}mm < {self.safe_distance:.1f}mm (COLLISION)")
+            print(f"   Time: {self.t_elapsed:.2f}s")
 
         return collision
 
@@ -276,23 +416,18 @@ class Crane:
         """Check if this crane is to the left of another crane"""
         return self.x < other_crane.x
 
-    def can_move_to_x(self, target_x, other_crane, safe_distance=None):
+    def can_move_to_x(self, target_x, other_crane):
         """
         Check if crane can move to target_x without colliding with other crane
 
         Args:
             target_x: Target X position in mm
             other_crane: Another Crane object
-            safe_distance: Minimum safe distance in mm
 
         Returns: Boolean
         """
-        if safe_distance is None:
-            safe_distance = self.safe_distance
-
         # Check if moving to target_x would cause collision
-        distance_to_other = abs(target_x - other_crane.x)
-        return distance_to_other >= safe_distance
+        return abs(target_x - other_crane.x) >= self.safe_distance
 
     def distance_to(self, x, y):
         """
@@ -300,11 +435,9 @@ class Crane:
 
         Returns: distance in mm
         """
-        dx = self.x - x
-        dy = self.y - y
-        return math.sqrt(dx**2 + dy**2)
+        return math.hypot(self.x - x, self.y - y)
 
-    def is_in_deadlock_with(self, other_crane):
+    def is_in_deadlock_with(self, other_crane, collision=None):
         """
         Check if both cranes are in a deadlock situation
         Deadlock occurs when both cranes are:
@@ -312,21 +445,20 @@ class Crane:
         2. Both trying to move (in movement states)
         3. NOT when one crane is actively working (picking/dropping/loading)
 
+        Args:
+            other_crane: Another Crane object
+            collision: Result of would_collide_with(other_crane) if already known
+
         Returns: Boolean
         """
         # Check if we're too close
-        if not self.would_collide_with(other_crane):
+        if collision is None:
+            collision = self.would_collide_with(other_crane)
+        if not collision:
             return False
 
         # Check if both cranes are in movement states
-        movement_states = [
-            "MOVE_TO_SCANNER", "MOVE_TO_BOX", "RETURN_HOME",
-            "MOVE_TO_START", "RETURN_TO_START", "RETURN_TO_HOME_WITH_DIAMOND",
-            "MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP", "MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD",
-            "MOVE_TO_BOX_THEN_RIGHT_SCANNER", "MOVE_TO_HOME_EMPTY"
-        ]
-
-        both_moving = (self.state in movement_states and other_crane.state in movement_states)
+        both_moving = (self.state in _MOVEMENT_STATES and other_crane.state in _MOVEMENT_STATES)
 
         if not both_moving:
             return False
@@ -334,14 +466,7 @@ class Crane:
         # CRITICAL: If blue crane is actively working (loading diamonds),
         # this is NOT a deadlock - red crane must always yield
         if other_crane.color == '#1f77b4':  # Blue crane
-            blue_working_states = [
-                "PICK_AT_START",              # Blue picking up diamond
-                "DROP_AT_SCANNER",            # Blue loading scanner
-                "MOVE_TO_SCANNER",            # Blue going to load
-                "RETURN_TO_START",            # Blue returning after loading
-                "RETURN_TO_HOME_WITH_DIAMOND" # Blue returning home with diamond
-            ]
-            if other_crane.state in blue_working_states:
+            if other_crane.state in _BLUE_WORKING_STATES:
                 return False  # Not a deadlock, red must yield
 
         return both_moving
@@ -378,38 +503,196 @@ class Crane:
 
         Returns: Boolean (True if this crane should wait)
         """
+        # Collision check is shared by the deadlock test and the simple case
+        collision = self.would_collide_with(other_crane)
+        if not collision:
+            # Far apart (the common case): no deadlock possible, nothing to yield
+            return False
+
         # First check if we're in a deadlock situation
-        in_deadlock = self.is_in_deadlock_with(other_crane)
+        in_deadlock = self.is_in_deadlock_with(other_crane, collision)
 
         if not in_deadlock:
             # Not in deadlock - use simple collision check
             # Both cranes wait for each other equally
-            result = self.would_collide_with(other_crane)
-            if result:
+            if collision and config.DEBUG_CRANE:
                 print(f"🚦 {self.color} crane YIELDING (simple collision):")
                 print(f"   Not a deadlock, just too close")
-            return result
+            return collision
 
         # In deadlock - use priority system
         # Should yield if OTHER crane has priority
         has_priority = self.has_priority_over(other_crane)
         should_yield = not has_priority
 
-        if should_yield:
-            print(f"🚦 {self.color} crane YIELDING (priority system):")
-            print(f"   In deadlock, {other_crane.color} has priority")
-        else:
-            print(f"🚦 {self.color} crane HAS PRIORITY:")
-            print(f"   In deadlock, this crane proceeds")
+        if config.DEBUG_CRANE:
+            if should_yield:
+                print(f"🚦 {self.color} crane YIELDING (priority system):")
+                print(f"   In deadlock, {other_crane.color} has priority")
+            else:
+                print(f"🚦 {self.color} crane HAS PRIORITY:")
+                print(f"   In deadlock, this crane proceeds")
 
         return should_yield
 
+    def _build_handler_table(self, handlers):
+        """
+        Turn a {CraneState: handler} mapping into a list indexed by state value
+
+        States this crane never enters get a no-op handler.
+        """
+        table = [self._step_unhandled] * len(CraneState)
+        for state, handler in handlers.items():
+            table[state] = handler
+        return table
+
+    def _step_unhandled(self, dt, other_crane):
+        """Handler for states that belong to the other crane: nothing to do"""
+        pass
+
+    def _home_target(self):
+        """Target for moves back to this crane's home position"""
+        return self.initial_x, self.initial_y
+
+    def _on_lost_target(self):
+        """Recover when a move's target becomes invalid (override in subclasses)"""
+        self._move_active = False
+        self._target_state = None
+        self.state = CraneState.WAIT
+
+    def _try_go_to(self, state, target_x, target_y, other_crane, blocked=None):
+        """
+        Start moving to (target_x, target_y) in `state` if the way is clear
+
+        The way is clear when this crane does not currently collide with
+        other_crane and the destination X keeps a safe distance from it.
+
+        Args:
+            state: Movement state to enter
+            target_x, target_y: Destination (mm)
+            other_crane: The other crane
+            blocked: Result of would_collide_with(other_crane) if already known
+
+        Returns: True if the move was started
+        """
+        if blocked is None:
+            blocked = self.would_collide_with(other_crane)
+        if blocked or not self.can_move_to_x(target_x, other_crane):
+            return False
+        self.state = state
+        self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
+        return True
+
+    def _start_move(self, state, target_x, target_y):
+        """
+        Enter movement state `state` heading for (target_x, target_y)
+
+        The target is handed to _step_move directly, so it is not looked up
+        again when the move starts.
+        """
+        self.state = state
+        self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
+        self._target_x = target_x
+        self._target_y = target_y
+        self._target_state = state
+
+    def _step_move(self, dt, other_crane):
+        """
+        Advance the current linear move by one time step
+
+        Every movement state is described by an entry in self._move_specs:
+        (target_fn, yield_check, on_arrive)
+            target_fn: returns the (x, y) target in mm, or None if the target is lost
+            yield_check: whether to yield to the other crane while moving
+            on_arrive: called once the crane has snapped onto the target
+
+        Args:
+            dt: Time step in seconds
+            other_crane: The other crane, for collision avoidance
+        """
+        # Runs every frame of every move: read the hot attributes once into locals
+        state = self.state
+        target_fn, yield_check, on_arrive = self._move_specs[state]
+
+        # Look up the target once per move instead of every frame
+        if self._target_state != state:
+            # Safety check: ensure the target is still valid
+            target = target_fn()
+            if target is None:
+                self._on_lost_target()
+                return
+            self._target_x, self._target_y = target
+            self._target_state = state
+        target_x = self._target_x
+        target_y = self._target_y
+
+        # Check for collision with other crane - use priority system
+        if yield_check and self.should_yield_to(other_crane):
+            x, y = self.x, self.y
+            if config.DEBUG_CRANE:
+                print(f"🛑 {self.color} crane {state.name} blocked by {other_crane.color} crane")
+                print(f"   X={x:.1f}, Other X={other_crane.x:.1f}, Distance={abs(x - other_crane.x):.1f}mm")
+            # CRITICAL FIX: Reset movement tracking and recalculate time
+            self._move_active = False
+
+            # Recalculate travel time from current position (a crane that is
+            # still yielding has not moved, so reuse the last answer)
+            yield_key = (x, y, target_x, target_y)
+            if yield_key != self._yield_key:
+                self._yield_key = yield_key
+                self._yield_travel_time = kinematics.travel_time_2d(
+                    x, y, target_x, target_y, self.vmax_x, self.a_x, self.vmax_y, self.a_y)
+            self.action_timer = self._yield_travel_time
+            return
+
+        if self._advance_linear_move(target_x, target_y, dt):
+            self._target_state = None
+            on_arrive()
+
+    def _advance_linear_move(self, target_x, target_y, dt):
+        """
+        Move one time step along the straight line toward (target_x, target_y)
+
+        Args:
+            target_x, target_y: Destination of the move (mm)
+            dt: Time step in seconds
+
+        Returns: True once the crane has arrived (snapped onto the target)
+        """
+        action_timer = self.action_timer
+        if action_timer > 0:
+            # Store initial position at start of movement
+            if not self._move_active:
+                # Deltas and 1 / duration are fixed for the whole move
+                self._move_start_x = self.x
+                self._move_start_y = self.y
+                self._move_dx = target_x - self.x
+                self._move_dy = target_y - self.y
+                self._move_inv_total_time = 1.0 / (action_timer + dt)
+                self._move_active = True
+
+            self.x, self.y, _ = kinematics.advance_linear(
+                self._move_start_x, self._move_start_y, self._move_dx, self._move_dy,
+                action_timer, self._move_inv_total_time)
+            self.update_position()
+            return False
+
+        # Arrived at target
+        self.x, self.y = target_x, target_y
+        self.update_position(force=True)
+        # Snap the diamond too (even when hidden) so it shows at the crane on pickup
+        self.update_carried_diamond(force=True)
+
+        # Clean up movement tracking
+        self._move_active = False
+        return True
+
     def reset(self):
         """Reset crane to initial state"""
         self.x = self.initial_x
         self.y = self.initial_y
         self.z = self.rail_y
-        self.state = "WAIT"
+        self.state = CraneState.WAIT
         self.action_timer = 0.0
         self.has_diamond = False
         self.target_i = None
@@ -418,17 +701,14 @@ class Crane:
         self.pick_phase = None
         self.drop_phase = None
         self.t_elapsed = 0.0
+        self._scanner_changes_seen = -1
 
         # CRITICAL: Clear all movement tracking variables
-        if hasattr(self, '_move_start_x'):
-            del self._move_start_x
-        if hasattr(self, '_move_start_y'):
-            del self._move_start_y
-        if hasattr(self, '_move_total_time'):
-            del self._move_total_time
+        self._move_active = False
+        self._target_state = None
 
-        self.update_position()
-        self.diamond.set_visible(False)
+        self.update_position(force=True)
+        self.set_diamond_visible(False)
 
 
 class BlueCrane(Crane):
@@ -442,12 +722,16 @@ class BlueCrane(Crane):
     4. Return to pickup zone
     """
 
+    __slots__ = ('start_diamond', 'scanners_loaded_mask', 'waiting_at_home',
+                 'waiting_for_red_to_clear', '_scanners_by_home_dist', '_nearest_empty', '_empty_scanners',
+                 '_scanner_drop_positions')
+
     def __init__(self, ax, scanner_list, **kwargs):
         """
         Initialize Blue Crane
 
         Args:
-            ax: Matplotlib axes
+            ax: Matplotlib axes (None for a headless crane that draws nothing)
             scanner_list: List of DScanner objects
             **kwargs: Additional parameters passed to Crane.__init__
         """
@@ -460,24 +744,61 @@ class BlueCrane(Crane):
         super().__init__(ax, '#1f77b4', **kwargs)
 
         self.scanner_list = scanner_list
-
-        # Track which scanners have been loaded
-        self.scanners_loaded = set()  # Track by index
+        # Scanners never move: cache their drop zones for the per-state targets
+        self._scanner_drop_positions = [scanner.get_drop_zone_position() for scanner in scanner_list]
+
+        # Scanners and HOME never move: rank scanner indices by squared distance
+        # from HOME once, so nearest_empty_scanner is a first-match scan
+        # (stable sort keeps the lower index first on ties, like min())
+        home_dist_sq = []
+        for scanner in scanner_list:
+            scanner_x, scanner_y = scanner.get_position()
+            dx = scanner_x - self.initial_x
+            dy = scanner_y - self.initial_y
+            home_dist_sq.append(dx * dx + dy * dy)
+        self._scanners_by_home_dist = tuple(sorted(range(len(scanner_list)),
+                                                   key=home_dist_sq.__getitem__))
+        # Empty scanner indices and the nearest of them to HOME, valid while
+        # no scanner has changed state since (see _refresh_empty_scanners)
+        self._empty_scanners = ()
+        self._nearest_empty = None
+
+        # Track which scanners have been loaded (bit i set = scanner i loaded)
+        self.scanners_loaded_mask = 0
         self.waiting_at_home = False
         self.waiting_for_red_to_clear = False  # New flag for coordination
 
+        self._move_specs = {
+            CraneState.MOVE_TO_START: (self._pickup_target, True, self._arrive_at_start),
+            CraneState.RETURN_TO_START: (self._pickup_target, True, self._arrive_at_start),
+            CraneState.MOVE_TO_SCANNER: (self._scanner_target, True, self._arrive_at_scanner),
+            # Moving out of the way after loading the right scanner must not stall on red
+            CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD: (self._home_target, False, self._arrive_home_with_diamond),
+            CraneState.RETURN_TO_HOME_WITH_DIAMOND: (self._home_target, True, self._arrive_home_with_diamond),
+            CraneState.MOVE_TO_HOME_EMPTY: (self._home_target, False, self._arrive_home_empty),
+        }
+
+        handlers = dict.fromkeys(self._move_specs, self._step_move)
+        handlers.update({
+            CraneState.WAIT: self._step_wait,
+            CraneState.PICK_AT_START: self._step_pick_at_start,
+            CraneState.DROP_AT_SCANNER: self._step_drop_at_scanner,
+            CraneState.WAIT_AT_HOME: self._step_wait_at_home,
+        })
+        self._handlers = self._build_handler_table(handlers)
+
         # Blue crane starts at HOME without a diamond - must go to START first
-        self.state = "MOVE_TO_START"
-        pickup_x, pickup_y = config.get_pickup_position()
-        self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
+        self.state = CraneState.MOVE_TO_START
+        self.action_timer = self.travel_time_2d(self.x, self.y, self._pickup_x, self._pickup_y)
 
         # Diamond at start position (always visible - infinite supply)
-        pickup_x, pickup_y = config.get_pickup_position()
-        display_x = config.mm_to_display(pickup_x)
-        display_y = config.mm_to_display(pickup_y)
-        self.start_diamond = make_diamond(display_x, display_y, '#33a3ff', size=0.18)
-        ax.add_patch(self.start_diamond)
-        self.start_diamond.set_visible(True)  # Always visible - represents infinite supply
+        display_x = config.mm_to_display(self._pickup_x)
+        display_y = config.mm_to_display(self._pickup_y)
+        self.start_diamond = None
+        if ax is not None:
+            self.start_diamond = make_diamond(display_x, display_y, '#33a3ff', size=0.18)
+            ax.add_patch(self.start_diamond)
+            self.start_diamond.set_visible(True)  # Always visible - represents infinite supply
 
     def get_diamond_color(self):
         """Blue diamonds for blue crane"""
@@ -487,36 +808,85 @@ class BlueCrane(Crane):
         """Reset blue crane to initial state"""
         super().reset()
         # Blue crane starts by going to START to pick up first diamond
-        self.state = "MOVE_TO_START"
-        pickup_x, pickup_y = config.get_pickup_position()
-        self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
+        self.state = CraneState.MOVE_TO_START
+        self.action_timer = self.travel_time_2d(self.x, self.y, self._pickup_x, self._pickup_y)
         # Start diamond is always visible
-        self.start_diamond.set_visible(True)
+        if self.start_diamond is not None:
+            self.start_diamond.set_visible(True)
         # Clear tracking
-        self.scanners_loaded = set()
+        self.scanners_loaded_mask = 0
         self.waiting_at_home = False
         self.waiting_for_red_to_clear = False
-        # Clear any movement tracking from parent reset
-        if hasattr(self, '_move_start_x'):
-            del self._move_start_x
-        if hasattr(self, '_move_start_y'):
-            del self._move_start_y
-        if hasattr(self, '_move_total_time'):
-            del self._move_total_time
 
-    def nearest_empty_scanner(self):
-        """Find nearest empty scanner to HOME position (for optimal loading)"""
-        empties = [i for i, scanner in enumerate(self.scanner_list) if scanner.state == "empty"]
-        if not empties:
+    def _pickup_target(self):
+        """Target for moves to the START pickup zone"""
+        return self._pickup_x, self._pickup_y
+
+    def _scanner_target(self):
+        """Target for moves to the drop zone of scanner target_i (None if invalid)"""
+        if self.target_i is None or self.target_i >= len(self.scanner_list):
             return None
+        return self._scanner_drop_positions[self.target_i]
+
+    def _on_lost_target(self):
+        """Lost scanner target - return to start"""
+        self._move_active = False
+        self._target_state = None
+        self.state = CraneState.RETURN_TO_START
+        self.action_timer = self.travel_time_2d(self.x, self.y, self._pickup_x, self._pickup_y)
+
+    def _arrive_at_start(self):
+        """Arrived at START - pick up the next diamond"""
+        self.state = CraneState.PICK_AT_START
+        self.action_timer = self.lower_time
+        self.pick_phase = "LOWER"
+
+    def _arrive_at_scanner(self):
+        """Arrived at scanner - drop the diamond"""
+        self.state = CraneState.DROP_AT_SCANNER
+        self.action_timer = self.lower_time
+        self.drop_phase = "LOWER"
+
+    def _arrive_home_with_diamond(self):
+        """Arrived home carrying a diamond - wait for a scanner to empty"""
+        self.state = CraneState.WAIT_AT_HOME
+        self.waiting_at_home = True
+
+    def _arrive_home_empty(self):
+        """Arrived home empty - wait for scanners to become available"""
+        self.state = CraneState.WAIT
+
+    def _refresh_empty_scanners(self):
+        """
+        Recompute the empty-scanner cache if any scanner changed state
+
+        Scanner states only change through DScanner methods that bump
+        DScanner.state_changes, so between changes the cache stays exact.
+        """
+        if self._scanner_changes_seen == DScanner.state_changes:
+            return
+        self._scanner_changes_seen = DScanner.state_changes
+        scanner_list = self.scanner_list
+        self._empty_scanners = tuple(i for i, scanner in enumerate(scanner_list)
+                                     if scanner.state == "empty")
 
         # Find closest to HOME position (not current position)
         # This ensures we load the scanner closest to where blue crane starts
-        return min(empties, key=lambda i: self.distance_to_position(
-            *self.scanner_list[i].get_position(),
-            from_x=self.initial_x,
-            from_y=self.initial_y
-        ))
+        self._nearest_empty = None
+        for i in self._scanners_by_home_dist:
+            if scanner_list[i].state == "empty":
+                self._nearest_empty = i
+                break
+
+    def empty_scanners(self):
+        """Indices of the currently empty scanners (tuple, cached between state changes)"""
+        self._refresh_empty_scanners()
+        return self._empty_scanners
+
+    def nearest_empty_scanner(self):
+        """Find nearest empty scanner to HOME position (for optimal loading)"""
+        self._refresh_empty_scanners()
+        return self._nearest_empty
 
     def distance_to_position(self, x, y, from_x=None, from_y=None):
         """
@@ -530,9 +900,7 @@ class BlueCrane(Crane):
         if from_y is None:
             from_y = self.y
 
-        dx = from_x - x
-        dy = from_y - y
-        return math.sqrt(dx**2 + dy**2)
+        return math.hypot(from_x - x, from_y - y)
 
     def step(self, dt, blue_crane, red_crane):
         """
@@ -543,474 +911,185 @@ class BlueCrane(Crane):
             blue_crane: Reference to self (for compatibility)
             red_crane: Reference to red crane for collision avoidance
         """
-        self.action_timer = max(0.0, self.action_timer - dt)
-
-        if self.state == "WAIT":
-            # Check if red crane is waiting for us to load the right scanner
-            if (red_crane.state == "MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP" or
-                    red_crane.state == "WAIT_FOR_BLUE_TO_LOAD_RIGHT"):
-                # Red crane picked from right scanner and is out of the way
-                # Check if right scanner (scanner 1) is empty
-                if len(self.scanner_list) > 1 and self.scanner_list[1].state == "empty":
-                    # We need to load the right scanner
-                    # First check if we have a diamond
-                    if self.has_diamond:
-                        # Go directly to right scanner
-                        self.target_i = 1
-                        target_x, target_y = self.scanner_list[1].get_drop_zone_position()
-                        self.state = "MOVE_TO_SCANNER"
-                        self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                        return
-                    else:
-                        # Go get a diamond first
-                        pickup_x, pickup_y = config.get_pickup_position()
-                        self.state = "MOVE_TO_START"
-                        self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
-                        # Remember we need to go to right scanner after picking up
-                        self.target_i = 1
-                        return
-
-            # Normal wait logic
-            target_i = self.nearest_empty_scanner()
-            if target_i is not None:
-                self.target_i = target_i
-                # Go to START to pick up diamond
-                pickup_x, pickup_y = config.get_pickup_position()
-                self.state = "MOVE_TO_START"
-                self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
-            else:
-                # No empty scanner - go to home position if not already there
-                if abs(self.x - self.initial_x) > 1.0 or abs(self.y - self.initial_y) > 1.0:
-                    self.state = "MOVE_TO_HOME_EMPTY"
-                    self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-
-        elif self.state == "MOVE_TO_START":
-            # Move crane to START position to pick up diamond
-            # Check for collision with red crane - use priority system
-            if self.should_yield_to(red_crane):
-                # CRITICAL FIX: Reset movement tracking and recalculate time
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Recalculate travel time from current position
-                pickup_x, pickup_y = config.get_pickup_position()
-                self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
-                return
-
-            if self.action_timer > 0:
-                pickup_x, pickup_y = config.get_pickup_position()
-
-                # Store initial position at start of movement
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-
-                # Calculate progress (0 to 1)
-                progress = 1.0 - (self.action_timer / self._move_total_time)
-
-                # Interpolate position
-                self.x = self._move_start_x + (pickup_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (pickup_y - self._move_start_y) * progress
-                self.update_position()
-            else:
-                # Arrived at START
-                pickup_x, pickup_y = config.get_pickup_position()
-                self.x, self.y = pickup_x, pickup_y
-                self.update_position()
-
-                # Clean up movement tracking
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Now pick up diamond
-                self.state = "PICK_AT_START"
-                self.action_timer = self.lower_time
-                self.pick_phase = "LOWER"
-
-        elif self.state == "PICK_AT_START":
-            # Two-phase pick: LOWER then RAISE
-            if self.pick_phase == "LOWER":
-                # Animate lowering
-                prog = 1.0 - (self.action_timer / self.lower_time)
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    # Finished lowering, now raise with diamond
-                    self.pick_phase = "RAISE"
-                    self.action_timer = self.raise_time
-                    self.has_diamond = True
-                    # Start diamond stays visible - infinite supply
-                    self.diamond.set_visible(True)
-
-            elif self.pick_phase == "RAISE":
-                # Animate raising
-                prog = self.action_timer / self.raise_time
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    # Finished raising, now check what to do next
-                    self.pick_phase = None
-                    self.set_hoist(self.x, self.y, self.top_y, False)
-
-                    # Check if we need to move out of way after loading right scanner
-                    if self.waiting_for_red_to_clear and self.has_diamond:
-                        self.waiting_for_red_to_clear = False
-                        self.state = "MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD"
-                        # Move far to the left (home position)
-                        self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                        return
-
-                    # PRIORITY: If red crane is waiting for us to load right scanner, do that first
-                    if (red_crane.state == "MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP" or
-                            red_crane.state == "WAIT_FOR_BLUE_TO_LOAD_RIGHT"):
-                        # Check if right scanner (scanner 1) is empty
-                        if len(self.scanner_list) > 1 and self.scanner_list[1].state == "empty":
-                            # Go directly to right scanner
-                            self.target_i = 1
-                            target_x, target_y = self.scanner_list[1].get_drop_zone_position()
-                            if self.can_move_to_x(target_x, red_crane):
-                                self.state = "MOVE_TO_SCANNER"
-                                self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                                return
-
-                    # Otherwise find next empty scanner
-                    self.target_i = self.nearest_empty_scanner()
-
-                    if self.target_i is not None:
-                        target_x, target_y = self.scanner_list[self.target_i].get_drop_zone_position()
-
-                        # Check if we can reach this scanner without collision
-                        if self.can_move_to_x(target_x, red_crane):
-                            self.state = "MOVE_TO_SCANNER"
-                            self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                        else:
-                            # Can't reach scanner due to red crane blocking
-                            self.state = "WAIT"
-                    else:
-                        # No empty scanner - go to home with diamond
-                        self.state = "RETURN_TO_HOME_WITH_DIAMOND"
-                        self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-
-        elif self.state == "MOVE_TO_SCANNER":
-            # Move crane in 2D from current position to target scanner
-            # Safety check: ensure target_i is valid
-            if self.target_i is None or self.target_i >= len(self.scanner_list):
-                # Lost target, return to start
-                self.state = "RETURN_TO_START"
-                pickup_x, pickup_y = config.get_pickup_position()
-                self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
-                return
-
-            # Check for collision with red crane - use priority system
-            if self.should_yield_to(red_crane):
-                # CRITICAL FIX: Reset movement tracking and recalculate time
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Recalculate travel time from current position
-                target_x, target_y = self.scanner_list[self.target_i].get_drop_zone_position()
-                self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                return
-
-            if self.action_timer > 0:
-                target_x, target_y = self.scanner_list[self.target_i].get_drop_zone_position()
-
-                # Store initial position at start of movement
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
+        # Count down, clamping at zero (plain compare instead of a max() call)
+        action_timer = self.action_timer - dt
+        self.action_timer = action_timer if action_timer > 0.0 else 0.0
+
+        self._handlers[self.state](dt, red_crane)
+
+        # Update diamond position if carrying (redraw threshold applied inside)
+        if self.has_diamond and self.x != self._diamond_drawn_x:
+            self.update_carried_diamond()
+
+    def _step_wait(self, dt, red_crane):
+        """WAIT: pick the next scanner to load (or head home if none is empty)"""
+        # Check if red crane is waiting for us to load the right scanner
+        if (1 << red_crane.state) & _RED_WAITING_FOR_RIGHT_LOAD_MASK:
+            # Red crane picked from right scanner and is out of the way
+            # Check if right scanner (scanner 1) is empty
+            if len(self.scanner_list) > self.RIGHT_SCANNER and self.scanner_list[self.RIGHT_SCANNER].state == "empty":
+                # We need to load the right scanner
+                # First check if we have a diamond
+                if self.has_diamond:
+                    # Go directly to right scanner
+                    self.target_i = self.RIGHT_SCANNER
+                    target_x, target_y = self._scanner_drop_positions[self.RIGHT_SCANNER]
+                    self.state = CraneState.MOVE_TO_SCANNER
+                    self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
+                    return
+                else:
+                    # Go get a diamond first
+                    self.state = CraneState.MOVE_TO_START
+                    self.action_timer = self.travel_time_2d(self.x, self.y, self._pickup_x, self._pickup_y)
+                    # Remember we need to go to right scanner after picking up
+                    self.target_i = self.RIGHT_SCANNER
+                    return
 
-                # Calculate progress (0 to 1)
-                progress = 1.0 - (self.action_timer / self._move_total_time)
+        # Normal wait logic
+        target_i = self.nearest_empty_scanner()
+        if target_i is not None:
+            self.target_i = target_i
+            # Go to START to pick up diamond
+            self.state = CraneState.MOVE_TO_START
+            self.action_timer = self.travel_time_2d(self.x, self.y, self._pickup_x, self._pickup_y)
+        else:
+            # No empty scanner - go to home position if not already there
+            if abs(self.x - self.initial_x) > 1.0 or abs(self.y - self.initial_y) > 1.0:
+                self.state = CraneState.MOVE_TO_HOME_EMPTY
+                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
 
-                # Interpolate position
-                self.x = self._move_start_x + (target_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (target_y - self._move_start_y) * progress
-                self.update_position()
-            else:
-                # Arrived at scanner
-                target_x, target_y = self.scanner_list[self.target_i].get_drop_zone_position()
-                self.x, self.y = target_x, target_y
-                self.update_position()
-
-                # Clean up movement tracking
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                self.state = "DROP_AT_SCANNER"
-                self.action_timer = self.lower_time
-                self.drop_phase = "LOWER"
-
-        elif self.state == "DROP_AT_SCANNER":
-            # Safety check: ensure target_i is valid
-            if self.target_i is None or self.target_i >= len(self.scanner_list):
-                # Lost target, return to start with diamond
-                self.state = "RETURN_TO_START"
-                pickup_x, pickup_y = config.get_pickup_position()
-                self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
+    def _step_pick_at_start(self, dt, red_crane):
+        """PICK_AT_START: two-phase pick (LOWER then RAISE) at the pickup zone"""
+        # Two-phase pick: LOWER then RAISE
+        lift = self._tick_lift(self.pick_phase)
+        if lift == "CONTACT":
+            # Finished lowering, now raise with diamond
+            self.pick_phase = "RAISE"
+            self.has_diamond = True
+            # Start diamond stays visible - infinite supply
+            self.set_diamond_visible(True)
+
+        elif lift == "DONE":
+            # Finished raising, now check what to do next
+            self.pick_phase = None
+
+            # Check if we need to move out of way after loading right scanner
+            if self.waiting_for_red_to_clear and self.has_diamond:
+                self.waiting_for_red_to_clear = False
+                self.state = CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD
+                # Move far to the left (home position)
+                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
                 return
 
-            # Two-phase drop: LOWER then RAISE
-            if self.drop_phase == "LOWER":
-                # Animate lowering
-                prog = 1.0 - (self.action_timer / self.lower_time)
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    # Finished lowering, drop diamond
-                    self.drop_phase = "RAISE"
-                    self.action_timer = self.raise_time
-                    self.has_diamond = False
-                    self.diamond.set_visible(False)
-
-                    # Trigger scanner to start scanning
-                    self.scanner_list[self.target_i].scan()
-
-            elif self.drop_phase == "RAISE":
-                # Animate raising
-                prog = self.action_timer / self.raise_time
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    # Finished raising
-                    self.drop_phase = None
-                    self.set_hoist(self.x, self.y, self.top_y, False)
-
-                    # Mark this scanner as loaded
-                    if self.target_i is not None:
-                        self.scanners_loaded.add(self.target_i)
-
-                    print(f"🔵 BLUE crane finished DROP_AT_SCANNER")
-                    print(f"   Position: X={self.x:.1f}, Y={self.y:.1f}")
-                    print(f"   Has diamond: {self.has_diamond}")
-                    print(f"   About to transition to RETURN_TO_START")
-
-                    # Check if we just loaded the right scanner while red crane is waiting
-                    if (self.target_i == 1 and
-                            red_crane.state == "WAIT_FOR_BLUE_TO_LOAD_RIGHT"):
-                        # We loaded right scanner, now go pick up another diamond and move out of way
-                        self.state = "RETURN_TO_START"
-                        pickup_x, pickup_y = config.get_pickup_position()
-                        self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
-                        # Set flag so we know to move out of way after picking up diamond
-                        self.waiting_for_red_to_clear = True
-                        print(f"   → Transitioning to RETURN_TO_START (special: red waiting)")
+            # PRIORITY: If red crane is waiting for us to load right scanner, do that first
+            if (1 << red_crane.state) & _RED_WAITING_FOR_RIGHT_LOAD_MASK:
+                # Check if right scanner (scanner 1) is empty
+                if len(self.scanner_list) > self.RIGHT_SCANNER and self.scanner_list[self.RIGHT_SCANNER].state == "empty":
+                    # Go directly to right scanner
+                    self.target_i = self.RIGHT_SCANNER
+                    target_x, target_y = self._scanner_drop_positions[self.RIGHT_SCANNER]
+                    if self.can_move_to_x(target_x, red_crane):
+                        self.state = CraneState.MOVE_TO_SCANNER
+                        self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
                         return
 
-                    # Always return to start for next diamond
-                    self.state = "RETURN_TO_START"
-                    pickup_x, pickup_y = config.get_pickup_position()
-                    self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
-                    print(f"   → Transitioned to RETURN_TO_START")
-                    print(f"   → Timer set to {self.action_timer:.2f}s")
-                    print(f"   → Current position AFTER transition: X={self.x:.1f}, Y={self.y:.1f}")
-                    print(f"   → Red crane position: X={red_crane.x:.1f}, Y={red_crane.y:.1f}, State={red_crane.state}")
-                    print(f"   → Distance to red: {abs(self.x - red_crane.x):.1f}mm")
-
-        elif self.state == "RETURN_TO_START":
-            # Move crane back to pickup zone
-            # Check for collision with red crane - use priority system
-            if self.should_yield_to(red_crane):
-                # CRITICAL FIX: Reset movement tracking and recalculate time
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Recalculate travel time from current position
-                pickup_x, pickup_y = config.get_pickup_position()
-                self.action_timer = self.travel_time_2d(self.x, self.y, pickup_x, pickup_y)
-                return
-
-            if self.action_timer > 0:
-                pickup_x, pickup_y = config.get_pickup_position()
-
-                # Store initial position at start of movement
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-                    print(f"🔵 BLUE crane starting RETURN_TO_START movement")
-                    print(f"   From: ({self.x:.1f}, {self.y:.1f}) To: ({pickup_x:.1f}, {pickup_y:.1f})")
-                    print(f"   Total time: {self._move_total_time:.2f}s")
+            # Otherwise find next empty scanner
+            self.target_i = self.nearest_empty_scanner()
 
-                # Calculate progress (0 to 1)
-                progress = 1.0 - (self.action_timer / self._move_total_time)
+            if self.target_i is not None:
+                target_x, target_y = self._scanner_drop_positions[self.target_i]
 
-                old_x = self.x
-                # Interpolate position
-                self.x = self._move_start_x + (pickup_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (pickup_y - self._move_start_y) * progress
-
-                # Log significant movement
-                if abs(old_x - self.x) > 10:  # Moved more than 10mm
-                    print(f"🔵 BLUE crane RETURN_TO_START: X={old_x:.1f} → {self.x:.1f} (progress={progress*100:.1f}%)")
-
-                self.update_position()
-            else:
-                # Arrived at start
-                pickup_x, pickup_y = config.get_pickup_position()
-                self.x, self.y = pickup_x, pickup_y
-                self.update_position()
-
-                # Clean up movement tracking
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Always pick up the next diamond
-                self.state = "PICK_AT_START"
-                self.action_timer = self.lower_time
-                self.pick_phase = "LOWER"
-
-        elif self.state == "MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD":
-            # Blue crane moves to home after picking up diamond and loading right scanner
-            # This clears the way for red crane to drop its diamond at the end box
-            if self.action_timer > 0:
-                # Store initial position at start of movement
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-
-                # Calculate progress (0 to 1)
-                progress = 1.0 - (self.action_timer / self._move_total_time)
-
-                # Interpolate position
-                self.x = self._move_start_x + (self.initial_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (self.initial_y - self._move_start_y) * progress
-                self.update_position()
+                # Check if we can reach this scanner without collision
+                if self.can_move_to_x(target_x, red_crane):
+                    self.state = CraneState.MOVE_TO_SCANNER
+                    self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
+                else:
+                    # Can't reach scanner due to red crane blocking
+                    self.state = CraneState.WAIT
             else:
-                # Arrived home
-                self.x, self.y = self.initial_x, self.initial_y
-                self.update_position()
-
-                # Clean up movement tracking
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Now wait at home
-                self.state = "WAIT_AT_HOME"
-                self.waiting_at_home = True
-
-        elif self.state == "RETURN_TO_HOME_WITH_DIAMOND":
-            # Move crane back to home position (left side) while carrying diamond
-            # Check for collision with red crane - use priority system
-            if self.should_yield_to(red_crane):
-                # CRITICAL FIX: Reset movement tracking and recalculate time
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Recalculate travel time from current position
+                # No empty scanner - go to home with diamond
+                self.state = CraneState.RETURN_TO_HOME_WITH_DIAMOND
                 self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                return
-
-            if self.action_timer > 0:
-                # Store initial position at start of movement
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-
-                # Calculate progress (0 to 1)
-                progress = 1.0 - (self.action_timer / self._move_total_time)
 
-                # Interpolate position
-                self.x = self._move_start_x + (self.initial_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (self.initial_y - self._move_start_y) * progress
-                self.update_position()
-            else:
-                # Arrived home
-                self.x, self.y = self.initial_x, self.initial_y
-                self.update_position()
-
-                # Clean up movement tracking
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Wait at home with diamond
-                self.state = "WAIT_AT_HOME"
-                self.waiting_at_home = True
-
-        elif self.state == "WAIT_AT_HOME":
-            # Waiting at home position (left side) with a diamond
-            # Check if any scanner became empty
-            empty_scanners = [i for i, scanner in enumerate(self.scanner_list) if scanner.state == "empty"]
-
-            if empty_scanners:
-                # A scanner became empty, remove it from loaded set and deliver diamond
-                for i in empty_scanners:
-                    if i in self.scanners_loaded:
-                        self.scanners_loaded.remove(i)
-
-                # Go directly to the empty scanner with our diamond
-                self.target_i = self.nearest_empty_scanner()
-                if self.target_i is not None:
-                    target_x, target_y = self.scanner_list[self.target_i].get_drop_zone_position()
-
-                    # Check if we can reach this scanner without collision
-                    if self.can_move_to_x(target_x, red_crane):
-                        self.state = "MOVE_TO_SCANNER"
-                        self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                        self.waiting_at_home = False
-                    # else: stay waiting at home until path is clear
-
-        elif self.state == "MOVE_TO_HOME_EMPTY":
-            # Move to home position without diamond (when no scanners need loading)
-            if self.action_timer > 0:
-                # Store initial position at start of movement
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-
-                # Calculate progress (0 to 1)
-                progress = 1.0 - (self.action_timer / self._move_total_time)
-
-                # Interpolate position
-                self.x = self._move_start_x + (self.initial_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (self.initial_y - self._move_start_y) * progress
-                self.update_position()
-            else:
-                # Arrived home
-                self.x, self.y = self.initial_x, self.initial_y
-                self.update_position()
-
-                # Clean up movement tracking
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
+    def _step_drop_at_scanner(self, dt, red_crane):
+        """DROP_AT_SCANNER: two-phase drop (LOWER then RAISE) into the target scanner"""
+        # Safety check: ensure target_i is valid
+        if self.target_i is None or self.target_i >= len(self.scanner_list):
+            # Lost target, return to start with diamond
+            self.state = CraneState.RETURN_TO_START
+            self.action_timer = self.travel_time_2d(self.x, self.y, self._pickup_x, self._pickup_y)
+            return
+
+        # Two-phase drop: LOWER then RAISE
+        lift = self._tick_lift(self.drop_phase)
+        if lift == "CONTACT":
+            # Finished lowering, drop diamond
+            self.drop_phase = "RAISE"
+            self.has_diamond = False
+            self.set_diamond_visible(False)
+
+            # Trigger scanner to start scanning
+            self.scanner_list[self.target_i].scan()
+
+        elif lift == "DONE":
+            # Finished raising
+            self.drop_phase = None
+
+            # Mark this scanner as loaded
+            if self.target_i is not None:
+                self.scanners_loaded_mask |= 1 << self.target_i
+
+            if config.DEBUG_CRANE:
+                print(f"🔵 BLUE crane finished DROP_AT_SCANNER")
+                print(f"   Position: X={self.x:.1f}, Y={self.y:.1f}")
+                print(f"   Has diamond: {self.has_diamond}")
+                print(f"   About to transition to RETURN_TO_START")
+
+            # Check if we just loaded the right scanner while red crane is waiting
+            if (self.target_i == self.RIGHT_SCANNER and
+                    red_crane.state == CraneState.WAIT_FOR_BLUE_TO_LOAD_RIGHT):
+                # We loaded right scanner, now go pick up another diamond and move out of way
+                self.state = CraneState.RETURN_TO_START
+                self.action_timer = self.travel_time_2d(self.x, self.y, self._pickup_x, self._pickup_y)
+                # Set flag so we know to move out of way after picking up diamond
+                self.waiting_for_red_to_clear = True
+                if config.DEBUG_CRANE:
+                    print(f"   → Transitioning to RETURN_TO_START (special: red waiting)")
+                return
 
-                # Wait at home for scanners to become available
-                self.state = "WAIT"
+            # Always return to start for next diamond
+            self.state = CraneState.RETURN_TO_START
+            self.action_timer = self.travel_time_2d(self.x, self.y, self._pickup_x, self._pickup_y)
+            if config.DEBUG_CRANE:
+                print(f"   → Transitioned to RETURN_TO_START")
+                print(f"   → Timer set to {self.action_timer:.2f}s")
+                print(f"   → Current position AFTER transition: X={self.x:.1f}, Y={self.y:.1f}")
+                print(f"   → Red crane position: X={red_crane.x:.1f}, Y={red_crane.y:.1f}, State={red_crane.state.name}")
+                print(f"   → Distance to red: {abs(self.x - red_crane.x):.1f}mm")
+
+    def _step_wait_at_home(self, dt, red_crane):
+        """WAIT_AT_HOME: hold a diamond at home until a scanner becomes empty"""
+        # Waiting at home position (left side) with a diamond
+        # Check if any scanner became empty (cached until a scanner changes state)
+        empty_scanners = self.empty_scanners()
+
+        if empty_scanners:
+            # A scanner became empty, remove it from loaded set and deliver diamond
+            for i in empty_scanners:
+                self.scanners_loaded_mask &= ~(1 << i)
+
+            # Go directly to the empty scanner with our diamond
+            self.target_i = self.nearest_empty_scanner()
+            if self.target_i is not None:
+                target_x, target_y = self._scanner_drop_positions[self.target_i]
+
+                # Check if we can reach this scanner without collision
+                if self.can_move_to_x(target_x, red_crane):
+                    self.state = CraneState.MOVE_TO_SCANNER
+                    self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
+                    self.waiting_at_home = False
+                # else: stay waiting at home until path is clear
 
-        # Update diamond position if carrying
-        if self.has_diamond:
-            display_x = config.mm_to_display(self.x)
-            display_y = config.mm_to_display(self.top_y)
-            self.diamond.xy = (display_x, display_y)
 
 
 class RedCrane(Crane):
@@ -1026,12 +1105,21 @@ class RedCrane(Crane):
     6. Return to home position
     """
 
+    # Move that follows a DROP_AT_BOX (values of _post_drop_action)
+    AFTER_DROP_HOME = 0
+    AFTER_DROP_LEFT_SCANNER = 1
+    AFTER_DROP_RIGHT_SCANNER = 2
+
+    __slots__ = ('box_list', 'target_box', 'from_rightmost', 'departure_times',
+                 '_scanner_drop_positions', '_post_drop_action', '_blue_clear_x',
+                 '_fixed_waiting_x')
+
     def __init__(self, ax, scanner_list, box_list, **kwargs):
         """
         Initialize Red Crane
 
         Args:
-            ax: Matplotlib axes
+            ax: Matplotlib axes (None for a headless crane that draws nothing)
             scanner_list: List of DScanner objects
             box_list: List of Box objects
             **kwargs: Additional parameters passed to Crane.__init__
@@ -1046,12 +1134,40 @@ class RedCrane(Crane):
 
         self.scanner_list = scanner_list
         self.box_list = box_list
+        # Scanners never move: cache their drop zones (targets and nearest_ready_scanner)
+        self._scanner_drop_positions = [scanner.get_drop_zone_position() for scanner in scanner_list]
         self.target_box = None
-        self.state = "WAIT"
+        self.state = CraneState.WAIT
         self.from_rightmost = False
+        # Where to go after the current DROP_AT_BOX (one of the AFTER_DROP_* values)
+        self._post_drop_action = self.AFTER_DROP_HOME
+        # Blue left of this X is clear of the right scanner (near home/start)
+        self._blue_clear_x = self._pickup_x + self.safe_distance * 2
+        # Waiting X after a right pickup: hard-coded 250mm right of the right scanner
+        self._fixed_waiting_x = self._scanner_drop_positions[self.RIGHT_SCANNER][0] + 250
 
         # Predictive scheduling - track when to depart for each scanner
-        self.departure_times = {}  # {scanner_index: departure_time}
+        # Planned departure time per scanner index (inf = nothing planned)
+        self.departure_times = [float('inf')] * len(scanner_list)
+
+        self._move_specs = {
+            CraneState.MOVE_TO_SCANNER: (self._scanner_target, True, self._arrive_at_scanner),
+            # Moving out of the way after a right pickup must not stall on blue
+            CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP: (self._right_pickup_waiting_target, False,
+                                                            self._arrive_at_waiting_position),
+            CraneState.MOVE_TO_BOX: (self._box_target, True, self._arrive_at_box),
+            CraneState.RETURN_HOME: (self._home_target, True, self._arrive_home),
+        }
+
+        handlers = dict.fromkeys(self._move_specs, self._step_move)
+        handlers.update({
+            CraneState.WAIT: self._step_wait,
+            CraneState.LOWER_FOR_PICKUP: self._step_lower_for_pickup,
+            CraneState.PICK_AT_SCANNER: self._step_pick_at_scanner,
+            CraneState.WAIT_FOR_BLUE_TO_LOAD_RIGHT: self._step_wait_for_blue_to_load_right,
+            CraneState.DROP_AT_BOX: self._step_drop_at_box,
+        })
+        self._handlers = self._build_handler_table(handlers)
 
     def get_diamond_color(self):
         """Red diamonds for red crane"""
@@ -1061,24 +1177,103 @@ class RedCrane(Crane):
         """Reset red crane to initial state"""
         super().reset()
         self.target_box = None
-        self.departure_times = {}
+        self.departure_times = [float('inf')] * len(self.scanner_list)
         self.from_rightmost = False
-        # Clear any movement tracking
-        if hasattr(self, '_move_start_x'):
-            del self._move_start_x
-        if hasattr(self, '_move_start_y'):
-            del self._move_start_y
-        if hasattr(self, '_move_total_time'):
-            del self._move_total_time
-
-    def nearest_ready_scanner(self):
-        """Find nearest ready scanner using 2D distance"""
-        ready = [i for i, scanner in enumerate(self.scanner_list) if scanner.state == "ready"]
+        self._post_drop_action = self.AFTER_DROP_HOME
+
+    def _scanner_target(self):
+        """Target for moves to the drop zone of scanner target_i (None if invalid)"""
+        if self.target_i is None or self.target_i >= len(self.scanner_list):
+            return None
+        return self._scanner_drop_positions[self.target_i]
+
+    def _box_target(self):
+        """Target for moves to end box target_box (None if invalid)"""
+        if self.target_box is None or self.target_box >= len(self.box_list):
+            return None
+        return self.box_list[self.target_box].get_position()
+
+    def _right_pickup_waiting_target(self):
+        """
+        FIXED waiting position after picking from the right scanner
+
+        X is hard-coded 250mm to the right of the right scanner (precomputed
+        at init), Y adapts to the target box row (falls back to scanner Y level).
+        """
+        if self.target_box is not None and self.target_box < len(self.box_list):
+            _, waiting_y = self.box_list[self.target_box].get_position()
+        else:
+            waiting_y = self._scanner_drop_positions[self.RIGHT_SCANNER][1]
+        return self._fixed_waiting_x, waiting_y
+
+    def _on_lost_target(self):
+        """Lost scanner/box target - return home"""
+        self._move_active = False
+        self._target_state = None
+        self.state = CraneState.RETURN_HOME
+        self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+
+    def _arrive_at_scanner(self):
+        """Arrived at scanner - decide next state based on scanner status"""
+        s_state = self.scanner_list[self.target_i].state
+        if s_state == "scanning":
+            self.state = CraneState.LOWER_FOR_PICKUP
+            self.action_timer = self.lower_time
+            self.pick_phase = "LOWER"
+        elif s_state in ("ready", "occupied"):
+            self.state = CraneState.PICK_AT_SCANNER
+            self.action_timer = self.lower_time
+            self.pick_phase = "LOWER"
+        else:
+            # Scanner empty or unexpected — return home
+            self.state = CraneState.RETURN_HOME
+            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+
+    def _arrive_at_waiting_position(self):
+        """Now wait for blue crane to load the right scanner and move out of the way"""
+        self.state = CraneState.WAIT_FOR_BLUE_TO_LOAD_RIGHT
+
+    def _arrive_at_box(self):
+        """Drop at box; the move after the drop was chosen when the box run started"""
+        self.state = CraneState.DROP_AT_BOX
+        self.action_timer = self.lower_time
+        self.drop_phase = "LOWER"
+
+    def _post_drop_default(self):
+        """After-drop action for a plain box run: try the left scanner after a right pickup, else go home"""
+        return self.AFTER_DROP_LEFT_SCANNER if self.from_rightmost else self.AFTER_DROP_HOME
+
+    def _arrive_home(self):
+        """Back home - wait for the next ready scanner"""
+        self.state = CraneState.WAIT
+
+    def nearest_ready_scanner(self, ready=None):
+        """
+        Find nearest ready scanner using 2D distance
+
+        Args:
+            ready: Optional list of ready scanner indices already collected
+                   by the caller (avoids scanning the list twice)
+        """
+        if ready is None:
+            ready = [i for i, scanner in enumerate(self.scanner_list) if scanner.state == "ready"]
         if not ready:
             return None
 
-        # Find closest using 2D distance
-        return min(ready, key=lambda i: self.distance_to(*self.scanner_list[i].get_drop_zone_position()))
+        # Find closest using squared 2D distance (same ordering, no sqrt)
+        x = self.x
+        y = self.y
+        nearest_i = None
+        nearest_dist_sq = float('inf')
+        for i in ready:
+            scanner_x, scanner_y = self._scanner_drop_positions[i]
+            dx = scanner_x - x
+            dy = scanner_y - y
+            dist_sq = dx * dx + dy * dy
+            if dist_sq < nearest_dist_sq:
+                nearest_i = i
+                nearest_dist_sq = dist_sq
+        return nearest_i
 
     def step(self, dt, blue_crane, red_crane):
         """
@@ -1089,157 +1284,140 @@ class RedCrane(Crane):
             blue_crane: Reference to blue crane for collision avoidance
             red_crane: Reference to self (for compatibility)
         """
-        # advance timers
-        self.action_timer = max(0.0, self.action_timer - dt)
-        self.t_elapsed = getattr(self, 't_elapsed', 0.0) + dt
-        current_time = self.t_elapsed
+        # advance timers (action_timer clamps at zero)
+        action_timer = self.action_timer - dt
+        self.action_timer = action_timer if action_timer > 0.0 else 0.0
+        self.t_elapsed += dt
+
+        self._handlers[self.state](dt, blue_crane)
+
+        # Update diamond visual if carrying (redraw threshold applied inside)
+        if self.has_diamond and self.x != self._diamond_drawn_x:
+            self.update_carried_diamond()
+
+    def _step_wait(self, dt, blue_crane):
+        """WAIT: predictive departure scheduling with a ready-scanner fallback"""
+        # Every scanner was empty last time and none has changed state since
+        if self._scanner_changes_seen == DScanner.state_changes:
+            return
 
-        if self.state == "WAIT":
-            # Predictive scheduling: compute/update departure times
-            earliest_to_depart = None
-            earliest_time = float('inf')
-            for i, scanner in enumerate(self.scanner_list):
-                if scanner.state == "scanning":
-                    time_until_ready = scanner.timer
-                    scanner_x, scanner_y = scanner.get_drop_zone_position()
-                    travel_time = self.travel_time_2d(self.x, self.y, scanner_x, scanner_y)
-
-                    departure_time = current_time + time_until_ready - travel_time - self.lower_time
-
-                    prev = self.departure_times.get(i)
-                    if prev is None or departure_time < prev:
-                        self.departure_times[i] = departure_time
-
-                    # If it's time to depart for this scanner
-                    if current_time >= self.departure_times[i]:
-                        # STRICT CHECK: Don't depart if blue crane is anywhere near the path
-                        if self.would_collide_with(blue_crane):
-                            # Currently too close to blue crane - wait
+        current_time = self.t_elapsed
+        x = self.x
+        y = self.y
+        lower_time = self.lower_time
+        departure_times = self.departure_times
+        drop_positions = self._scanner_drop_positions
+
+        # Predictive scheduling: compute/update departure times
+        earliest_to_depart = None
+        earliest_time = float('inf')
+        # Collect ready scanners in the same pass, but only while the fallback
+        # below can still use them
+        collect_ready = self.target_i is None
+        ready_scanners = []
+        scanner_busy = False
+        for i, scanner in enumerate(self.scanner_list):
+            scanner_state = scanner.state
+            if scanner_state == "ready":
+                scanner_busy = True
+                if collect_ready:
+                    ready_scanners.append(i)
+            elif scanner_state == "scanning":
+                scanner_busy = True
+                scanner_x, scanner_y = drop_positions[i]
+                departure_time = departure_times[i]
+
+                if departure_time == math.inf:
+                    # Red is parked and the scan timer counts down in step with
+                    # the clock, so the departure time is fixed once predicted
+                    travel_time = self.travel_time_2d(x, y, scanner_x, scanner_y)
+                    departure_time = current_time + scanner.timer - travel_time - lower_time
+                    departure_times[i] = departure_time
+
+                # If it's time to depart for this scanner
+                if current_time >= departure_time:
+                    # STRICT CHECK: Don't depart if blue crane is anywhere near the path
+                    if self.would_collide_with(blue_crane):
+                        # Currently too close to blue crane - wait
+                        if config.DEBUG_CRANE:
                             print(f"🔴 RED crane WAIT: Can't depart (collision with blue)")
                             print(f"   Red X={self.x:.1f}, Blue X={blue_crane.x:.1f}")
-                            continue
+                        continue
 
-                        if not self.can_move_to_x(scanner_x, blue_crane):
-                            # Destination would be too close to blue crane - wait
+                    if not self.can_move_to_x(scanner_x, blue_crane):
+                        # Destination would be too close to blue crane - wait
+                        if config.DEBUG_CRANE:
                             print(f"🔴 RED crane WAIT: Can't depart (destination unsafe)")
                             print(f"   Target X={scanner_x:.1f}, Blue X={blue_crane.x:.1f}")
-                            continue
+                        continue
 
-                        # Both checks passed - safe to depart
+                    # Both checks passed - safe to depart
+                    if config.DEBUG_CRANE:
                         print(f"🔴 RED crane WAIT: DEPARTING to scanner {i}")
                         print(f"   Red X={self.x:.1f}, Blue X={blue_crane.x:.1f}")
-                        print(f"   Blue state={blue_crane.state}, Blue has_diamond={blue_crane.has_diamond}")
+                        print(f"   Blue state={blue_crane.state.name}, Blue has_diamond={blue_crane.has_diamond}")
                         print(f"   Target scanner X={scanner_x:.1f}")
-                        self.target_i = i
-                        self.target_box = scanner.get_target_box()
-                        self.state = "MOVE_TO_SCANNER"
-                        self.action_timer = travel_time
-                        # Clear stored prediction
-                        self.departure_times.pop(i, None)
+                    self.target_i = i
+                    self.target_box = scanner.get_target_box()
+                    self.state = CraneState.MOVE_TO_SCANNER
+                    self.action_timer = self.travel_time_2d(x, y, scanner_x, scanner_y)
+                    # Clear stored prediction
+                    departure_times[i] = float('inf')
+                    # Track if this is the right scanner
+                    self.from_rightmost = (i == self.RIGHT_SCANNER)
+                    break
+
+        if not scanner_busy:
+            # Nothing to schedule until some scanner changes state
+            self._scanner_changes_seen = DScanner.state_changes
+            return
+
+        # Fallback: if no scheduled run and a scanner is already ready
+        if self.target_i is None:
+            if ready_scanners:
+                target_i = self.nearest_ready_scanner(ready_scanners)
+                if target_i is not None:
+                    target_x, target_y = self._scanner_drop_positions[target_i]
+
+                    # STRICT CHECK: Don't depart if blue crane is anywhere near
+                    if self._try_go_to(CraneState.MOVE_TO_SCANNER, target_x, target_y, blue_crane):
+                        # Safe to depart
+                        self.target_i = target_i
+                        self.target_box = self.scanner_list[target_i].get_target_box()
                         # Track if this is the right scanner
-                        self.from_rightmost = (i == 1)
-                        break
-
-            # Fallback: if no scheduled run and a scanner is already ready
-            if self.target_i is None:
-                ready_scanners = [i for i, s in enumerate(self.scanner_list) if s.state == "ready"]
-                if ready_scanners:
-                    target_i = self.nearest_ready_scanner()
-                    if target_i is not None:
-                        target_x, target_y = self.scanner_list[target_i].get_drop_zone_position()
-
-                        # STRICT CHECK: Don't depart if blue crane is anywhere near
-                        if self.would_collide_with(blue_crane):
-                            # Currently too close - don't move
-                            pass
-                        elif not self.can_move_to_x(target_x, blue_crane):
-                            # Destination would be too close - don't move
-                            pass
-                        else:
-                            # Safe to depart
-                            self.target_i = target_i
-                            self.target_box = self.scanner_list[target_i].get_target_box()
-                            self.state = "MOVE_TO_SCANNER"
-                            self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                            # Track if this is the right scanner
-                            self.from_rightmost = (target_i == 1)
-
-        elif self.state == "MOVE_TO_SCANNER":
-            # Safety check: ensure target_i is valid
-            if self.target_i is None or self.target_i >= len(self.scanner_list):
-                self.state = "RETURN_HOME"
-                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                return
-
-            # Collision with blue crane - use priority system
-            if self.should_yield_to(blue_crane):
-                print(f"🛑 RED crane MOVE_TO_SCANNER blocked by blue crane")
-                print(f"   Red X={self.x:.1f}, Blue X={blue_crane.x:.1f}, Distance={abs(self.x - blue_crane.x):.1f}mm")
-                # CRITICAL FIX: Reset movement tracking and recalculate time
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Recalculate travel time from current position
-                target_x, target_y = self.scanner_list[self.target_i].get_drop_zone_position()
-                self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                return
+                        self.from_rightmost = (target_i == self.RIGHT_SCANNER)
+
+    def _step_lower_for_pickup(self, dt, blue_crane):
+        """LOWER_FOR_PICKUP: lower onto a scanner that is still scanning"""
+        if self.target_i is None or self.target_i >= len(self.scanner_list):
+            self.state = CraneState.RETURN_HOME
+            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+            return
+
+        # If scanner became ready while lowering
+        if self.scanner_list[self.target_i].state == "ready" and self.action_timer <= 0:
+            self.pick_phase = "RAISE"
+            self.action_timer = self.raise_time
+            self.has_diamond = True
+
+            box_id = self.scanner_list[self.target_i].pickup()
+            if box_id is not None:
+                self.target_box = box_id
             else:
-                # Log when red crane is allowed to proceed
-                if abs(self.x - blue_crane.x) < 150:  # Log if within 150mm
-                    print(f"✅ RED crane MOVE_TO_SCANNER proceeding (not yielding)")
-                    print(f"   Red X={self.x:.1f}, Blue X={blue_crane.x:.1f}, Distance={abs(self.x - blue_crane.x):.1f}mm")
-                    print(f"   Blue state={blue_crane.state}, Blue has_diamond={blue_crane.has_diamond}")
-
-            if self.action_timer > 0:
-                target_x, target_y = self.scanner_list[self.target_i].get_drop_zone_position()
-
-                # Store interpolation start
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-
-                progress = 1.0 - (self.action_timer / self._move_total_time)
-
-                self.x = self._move_start_x + (target_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (target_y - self._move_start_y) * progress
-                self.update_position()
-            else:
-                # Arrived at scanner
-                target_x, target_y = self.scanner_list[self.target_i].get_drop_zone_position()
-                self.x, self.y = target_x, target_y
-                self.update_position()
-
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Decide next state based on scanner status
-                s_state = self.scanner_list[self.target_i].state
-                if s_state == "scanning":
-                    self.state = "LOWER_FOR_PICKUP"
-                    self.action_timer = self.lower_time
-                    self.pick_phase = "LOWER"
-                elif s_state in ("ready", "occupied"):
-                    self.state = "PICK_AT_SCANNER"
-                    self.action_timer = self.lower_time
-                    self.pick_phase = "LOWER"
-                else:
-                    # Scanner empty or unexpected — return home
-                    self.state = "RETURN_HOME"
-                    self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+                # defensive fallback
+                self.target_box = self.scanner_list[self.target_i].get_target_box()
+            self.set_diamond_visible(True)
 
-        elif self.state == "LOWER_FOR_PICKUP":
-            if self.target_i is None or self.target_i >= len(self.scanner_list):
-                self.state = "RETURN_HOME"
-                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                return
+            self.state = CraneState.PICK_AT_SCANNER
+            return
 
-            # If scanner became ready while lowering
-            if self.scanner_list[self.target_i].state == "ready" and self.action_timer <= 0:
+        # Animate lowering
+        self._animate_hoist(self._inv_lower, rising=False)
+
+        if self.action_timer <= 0:
+            # At bottom, wait until scanner ready
+            self.set_hoist(self.x, self.y, self.top_y, True)
+            if self.scanner_list[self.target_i].state == "ready":
                 self.pick_phase = "RAISE"
                 self.action_timer = self.raise_time
                 self.has_diamond = True
@@ -1250,558 +1428,221 @@ class RedCrane(Crane):
                 else:
                     # defensive fallback
                     self.target_box = self.scanner_list[self.target_i].get_target_box()
-                self.diamond.set_visible(True)
-
-                self.state = "PICK_AT_SCANNER"
-                return
-
-            # Animate lowering
-            prog = 1.0 - (self.action_timer / self.lower_time)
-            z = self.rail_y - (self.rail_y - self.top_y) * prog
-            self.set_hoist(self.x, self.y, z, True)
-
-            if self.action_timer <= 0:
-                # At bottom, wait until scanner ready
-                self.set_hoist(self.x, self.y, self.top_y, True)
-                if self.scanner_list[self.target_i].state == "ready":
-                    self.pick_phase = "RAISE"
-                    self.action_timer = self.raise_time
-                    self.has_diamond = True
-
-                    box_id = self.scanner_list[self.target_i].pickup()
-                    if box_id is not None:
-                        self.target_box = box_id
-                    else:
-                        # defensive fallback
-                        self.target_box = self.scanner_list[self.target_i].get_target_box()
-                    self.diamond.set_visible(True)
-
-                    self.state = "PICK_AT_SCANNER"
-
-        elif self.state == "PICK_AT_SCANNER":
-            if self.target_i is None or self.target_i >= len(self.scanner_list):
-                self.state = "RETURN_HOME"
-                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                return
-
-            # SPECIAL CASE: If we're here with no timer and no phase, we finished picking
-            # but couldn't move because blue crane was blocking. Retry the transition.
-            if self.action_timer <= 0 and self.pick_phase is None:
-                if self.target_box is None:
-                    self.target_box = 0
-
-                # From left scanner - check if should go to right scanner or to box
-                if not self.from_rightmost:
-                    if len(self.scanner_list) > 1:
-                        right_scanner = self.scanner_list[1]
-                        if right_scanner.state in ("ready", "scanning"):
-                            target_x, target_y = right_scanner.get_drop_zone_position()
-
-                            if not self.would_collide_with(blue_crane) and self.can_move_to_x(target_x, blue_crane):
-                                # Now safe to go to right scanner
-                                self.target_i = 1
-                                self.target_box = right_scanner.get_target_box()
-                                self.state = "MOVE_TO_BOX_THEN_RIGHT_SCANNER"
-                                box_x, box_y = self.box_list[self.target_box].get_position()
-                                self.action_timer = self.travel_time_2d(self.x, self.y, box_x, box_y)
-                                return
-
-                # Try to go to box
-                if self.target_box is not None and self.target_box < len(self.box_list):
-                    target_x, target_y = self.box_list[self.target_box].get_position()
-
-                    if not self.would_collide_with(blue_crane):
-                        # Now safe to go to box
-                        self.state = "MOVE_TO_BOX"
-                        self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                        return
-
-                # Still blocked - just wait here (will retry next frame)
-                return
-
-            if self.pick_phase == "LOWER":
-                prog = 1.0 - (self.action_timer / self.lower_time)
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    self.pick_phase = "RAISE"
-                    self.action_timer = self.raise_time
-                    self.has_diamond = True
-
-                    box_id = self.scanner_list[self.target_i].pickup()
-                    if box_id is not None:
-                        self.target_box = box_id
-                    else:
-                        # defensive fallback
-                        self.target_box = self.scanner_list[self.target_i].get_target_box()
-                    self.diamond.set_visible(True)
-
-            elif self.pick_phase == "RAISE":
-                prog = self.action_timer / self.raise_time
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    self.pick_phase = None
-                    self.set_hoist(self.x, self.y, self.top_y, False)
-
-                    if self.target_box is None:
-                        # fallback: pick box 0 if none set
-                        self.target_box = 0
-
-                    # NEW COORDINATION LOGIC: If we just picked from right scanner
-                    if self.from_rightmost:
-                        # Remove right scanner from blue crane's loaded set so it knows to reload it
-                        if hasattr(blue_crane, 'scanners_loaded') and 1 in blue_crane.scanners_loaded:
-                            blue_crane.scanners_loaded.remove(1)
-
-                        # Move out of the way to a FIXED X position
-                        # This ensures consistent behavior and no blocking issues
-                        self.state = "MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP"
-
-                        # HARD-CODED X POSITION: Calculate once based on scanner position
-                        rightmost_scanner_x, _ = self.scanner_list[1].get_drop_zone_position()
-                        # Fixed waiting X: 250mm to the right of the right scanner
-                        fixed_waiting_x = rightmost_scanner_x + 250
-
-                        if self.target_box is not None and self.target_box < len(self.box_list):
-                            # Y position adapts to target box row
-                            _, target_box_y = self.box_list[self.target_box].get_position()
-                            self.action_timer = self.travel_time_2d(self.x, self.y, fixed_waiting_x, target_box_y)
-                        else:
-                            # Fallback: stay at scanner Y level
-                            _, rightmost_scanner_y = self.scanner_list[1].get_drop_zone_position()
-                            self.action_timer = self.travel_time_2d(self.x, self.y, fixed_waiting_x, rightmost_scanner_y)
-                    else:
-                        # From left scanner - check if should go to right scanner or to box
-                        # STRICT CHECK: Only proceed if blue crane is not in the way
-                        if len(self.scanner_list) > 1:
-                            right_scanner = self.scanner_list[1]
-                            if right_scanner.state in ("ready", "scanning"):
-                                # Check if blue crane blocks the path
-                                target_x, target_y = right_scanner.get_drop_zone_position()
-
-                                # CRITICAL: Check collision before committing to movement
-                                if not self.would_collide_with(blue_crane) and self.can_move_to_x(target_x, blue_crane):
-                                    # Safe to go to right scanner
-                                    self.target_i = 1
-                                    self.target_box = right_scanner.get_target_box()
-                                    self.state = "MOVE_TO_BOX_THEN_RIGHT_SCANNER"
-                                    # First go to box to drop current diamond
-                                    box_x, box_y = self.box_list[self.target_box].get_position()
-                                    self.action_timer = self.travel_time_2d(self.x, self.y, box_x, box_y)
-                                    return
-
-                        # Default behavior: go to box
-                        # STRICT CHECK: Ensure path to box is clear
-                        if self.target_box is not None and self.target_box < len(self.box_list):
-                            target_x, target_y = self.box_list[self.target_box].get_position()
-
-                            # Check collision before going to box
-                            if not self.would_collide_with(blue_crane):
-                                self.state = "MOVE_TO_BOX"
-                                self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                            else:
-                                # Blue crane in the way - stay here and check next frame
-                                # Don't transition to movement state yet
-                                pass
-                        else:
-                            # No valid box - return home
-                            self.state = "RETURN_HOME"
-                            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-
-        elif self.state == "MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP":
-            # Red crane moves to FIXED waiting position - X is hard-coded, Y adapts to target box
-            if self.action_timer > 0:
-                # HARD-CODED X POSITION
-                rightmost_scanner_x, _ = self.scanner_list[1].get_drop_zone_position()
-                fixed_waiting_x = rightmost_scanner_x + 250  # Fixed: 250mm right of scanner
-
-                # Y position adapts to target box
-                if self.target_box is not None and self.target_box < len(self.box_list):
-                    _, target_box_y = self.box_list[self.target_box].get_position()
-                    waiting_y = target_box_y
-                else:
-                    # Fallback
-                    _, rightmost_scanner_y = self.scanner_list[1].get_drop_zone_position()
-                    waiting_y = rightmost_scanner_y
-
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-
-                progress = 1.0 - (self.action_timer / self._move_total_time)
-                self.x = self._move_start_x + (fixed_waiting_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (waiting_y - self._move_start_y) * progress
-                self.update_position()
+                self.set_diamond_visible(True)
+
+                self.state = CraneState.PICK_AT_SCANNER
+
+    def _step_pick_at_scanner(self, dt, blue_crane):
+        """PICK_AT_SCANNER: two-phase pick (LOWER then RAISE) from the target scanner"""
+        if self.target_i is None or self.target_i >= len(self.scanner_list):
+            self.state = CraneState.RETURN_HOME
+            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+            return
+
+        # SPECIAL CASE: If we're here with no timer and no phase, we finished picking
+        # but couldn't move because blue crane was blocking. Retry the transition.
+        if self.action_timer <= 0 and self.pick_phase is None:
+            if self.target_box is None:
+                self.target_box = 0
+
+            self._leave_scanner_with_diamond(blue_crane, home_if_no_box=False)
+            # Still blocked - just wait here (will retry next frame)
+            return
+
+        lift = self._tick_lift(self.pick_phase)
+        if lift == "CONTACT":
+            self.pick_phase = "RAISE"
+            self.has_diamond = True
+
+            box_id = self.scanner_list[self.target_i].pickup()
+            if box_id is not None:
+                self.target_box = box_id
             else:
-                # Arrived at waiting position
-                rightmost_scanner_x, _ = self.scanner_list[1].get_drop_zone_position()
-                fixed_waiting_x = rightmost_scanner_x + 250
-
-                if self.target_box is not None and self.target_box < len(self.box_list):
-                    _, target_box_y = self.box_list[self.target_box].get_position()
-                    waiting_y = target_box_y
-                else:
-                    _, rightmost_scanner_y = self.scanner_list[1].get_drop_zone_position()
-                    waiting_y = rightmost_scanner_y
-
-                self.x, self.y = fixed_waiting_x, waiting_y
-                self.update_position()
-
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Now wait for blue crane to load the right scanner and move out of the way
-                self.state = "WAIT_FOR_BLUE_TO_LOAD_RIGHT"
-
-        elif self.state == "WAIT_FOR_BLUE_TO_LOAD_RIGHT":
-            # Wait at fixed position until blue crane is out of the way
-            # Red crane stays at: (rightmost_scanner_x + 250, target_box_y)
-
-            # Check if blue crane is out of the way
-            pickup_x, _ = config.get_pickup_position()
-            blue_is_out_of_way = (
-                # State-based check
-                    blue_crane.state in ("WAIT_AT_HOME", "MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD", "WAIT", "MOVE_TO_HOME_EMPTY") or
-                    # Position-based check: blue crane is far to the left (near home/start)
-                    blue_crane.x < pickup_x + self.safe_distance * 2
-            )
-
-            if blue_is_out_of_way:
-                # Blue crane is out of the way, we can now go to the box
-                if self.target_box is not None and self.target_box < len(self.box_list):
-                    target_x, target_y = self.box_list[self.target_box].get_position()
-
-                    # Clean up any old movement tracking before starting new movement
-                    if hasattr(self, '_move_start_x'):
-                        del self._move_start_x
-                    if hasattr(self, '_move_start_y'):
-                        del self._move_start_y
-                    if hasattr(self, '_move_total_time'):
-                        del self._move_total_time
-
-                    self.state = "MOVE_TO_BOX"
-                    self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                    # Signal to blue crane that we're moving
-                    if hasattr(blue_crane, 'waiting_for_red_to_clear'):
-                        blue_crane.waiting_for_red_to_clear = True
-                return
-
-            # Otherwise just wait at current position - no staging movement needed
+                # defensive fallback
+                self.target_box = self.scanner_list[self.target_i].get_target_box()
+            self.set_diamond_visible(True)
+
+        elif lift == "DONE":
+            self.pick_phase = None
+
+            if self.target_box is None:
+                # fallback: pick box 0 if none set
+                self.target_box = 0
+
+            # NEW COORDINATION LOGIC: If we just picked from right scanner
+            if self.from_rightmost:
+                # Remove right scanner from blue crane's loaded set so it knows to reload it
+                blue_crane.scanners_loaded_mask &= ~self.RIGHT_SCANNER_MASK
+
+                # Move out of the way to a FIXED X position
+                # This ensures consistent behavior and no blocking issues
+                # HARD-CODED X POSITION, Y adapts to target box row
+                waiting_x, waiting_y = self._right_pickup_waiting_target()
+                self._start_move(CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP, waiting_x, waiting_y)
+            else:
+                # From left scanner - if blocked, the retry above picks this up next frame
+                self._leave_scanner_with_diamond(blue_crane, home_if_no_box=True)
 
-        elif self.state == "MOVE_TO_BOX_THEN_RIGHT_SCANNER":
-            # Special state: after dropping at box from left scanner, go to right scanner
-            if self.target_box is None or self.target_box >= len(self.box_list):
-                self.state = "RETURN_HOME"
-                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                return
+    def _leave_scanner_with_diamond(self, blue_crane, home_if_no_box):
+        """
+        After a pick, head for the box (from the left scanner, optionally via
+        the right scanner). Stays put if the blue crane is in the way; PICK_AT_SCANNER
+        retries next frame.
 
-            if self.should_yield_to(blue_crane):
-                # CRITICAL FIX: Reset movement tracking and recalculate time
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
+        Args:
+            blue_crane: The other crane, checked for collisions
+            home_if_no_box: Return home when target_box is not a valid box
+        """
+        # Neither crane moves while deciding, so check collision once
+        blocked = self.would_collide_with(blue_crane)
+
+        if not self.from_rightmost and len(self.scanner_list) > self.RIGHT_SCANNER:
+            right_scanner = self.scanner_list[self.RIGHT_SCANNER]
+            if right_scanner.state in ("ready", "scanning"):
+                target_x, target_y = right_scanner.get_drop_zone_position()
+
+                # CRITICAL: Check collision before committing to movement
+                if not blocked and self.can_move_to_x(target_x, blue_crane):
+                    # Safe to go to right scanner, dropping at the box first
+                    self.target_i = self.RIGHT_SCANNER
+                    self.target_box = right_scanner.get_target_box()
+                    self.state = CraneState.MOVE_TO_BOX
+                    self._post_drop_action = self.AFTER_DROP_RIGHT_SCANNER
+                    box_x, box_y = self.box_list[self.target_box].get_position()
+                    self.action_timer = self.travel_time_2d(self.x, self.y, box_x, box_y)
+                    return
 
-                # Recalculate travel time from current position
+        # Default behavior: go to box once the path is clear
+        if self.target_box is not None and self.target_box < len(self.box_list):
+            if not blocked:
                 target_x, target_y = self.box_list[self.target_box].get_position()
+                self.state = CraneState.MOVE_TO_BOX
+                self._post_drop_action = self._post_drop_default()
                 self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                return
+        elif home_if_no_box:
+            # No valid box - return home
+            self.state = CraneState.RETURN_HOME
+            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+
+    def _step_wait_for_blue_to_load_right(self, dt, blue_crane):
+        """WAIT_FOR_BLUE_TO_LOAD_RIGHT: hold at the fixed waiting position until blue is clear"""
+        # Wait at fixed position until blue crane is out of the way
+        # Red crane stays at: (rightmost_scanner_x + 250, target_box_y)
+
+        # Check if blue crane is out of the way
+        blue_is_out_of_way = (
+            # State-based check
+                (1 << blue_crane.state) & _BLUE_CLEAR_OF_RIGHT_MASK or
+                # Position-based check: blue crane is far to the left (near home/start)
+                blue_crane.x < self._blue_clear_x
+        )
 
-            if self.action_timer > 0:
+        if blue_is_out_of_way:
+            # Blue crane is out of the way, we can now go to the box
+            if self.target_box is not None and self.target_box < len(self.box_list):
                 target_x, target_y = self.box_list[self.target_box].get_position()
 
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-
-                progress = 1.0 - (self.action_timer / self._move_total_time)
-                self.x = self._move_start_x + (target_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (target_y - self._move_start_y) * progress
-                self.update_position()
-            else:
-                target_x, target_y = self.box_list[self.target_box].get_position()
-                self.x, self.y = target_x, target_y
-                self.update_position()
-
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Drop at box, then go to right scanner
-                self.state = "DROP_AT_BOX_THEN_RIGHT_SCANNER"
-                self.action_timer = self.lower_time
-                self.drop_phase = "LOWER"
-
-        elif self.state == "DROP_AT_BOX_THEN_RIGHT_SCANNER":
-            # Drop diamond at box, then go to right scanner
-            if self.target_box is None or self.target_box >= len(self.box_list):
-                self.state = "RETURN_HOME"
-                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                return
+                # Clean up any old movement tracking before starting new movement
+                self._move_active = False
 
-            # SPECIAL CASE: If we're here with no timer and no phase, we finished dropping
-            # but couldn't move because blue crane was blocking. Retry the transition.
-            if self.action_timer <= 0 and self.drop_phase is None:
-                if len(self.scanner_list) > 1:
-                    target_x, target_y = self.scanner_list[1].get_drop_zone_position()
-
-                    if not self.would_collide_with(blue_crane) and self.can_move_to_x(target_x, blue_crane):
-                        # Now safe to proceed to right scanner
-                        self.target_i = 1
-                        self.from_rightmost = True
-                        self.state = "MOVE_TO_SCANNER"
-                        self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                        return
-                    else:
-                        # Still blocked - try going home instead
-                        if not self.would_collide_with(blue_crane):
-                            self.state = "RETURN_HOME"
-                            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                            return
-                else:
-                    # No right scanner
-                    self.state = "RETURN_HOME"
-                    self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                    return
-
-                # Still blocked - wait here (will retry next frame)
-                return
-
-            if self.drop_phase == "LOWER":
-                prog = 1.0 - (self.action_timer / self.lower_time)
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    self.drop_phase = "RAISE"
-                    self.action_timer = self.raise_time
-                    self.has_diamond = False
-                    self.diamond.set_visible(False)
-
-                    diamond_patch = self.box_list[self.target_box].add_diamond()
-                    self.ax.add_patch(diamond_patch)
-
-            elif self.drop_phase == "RAISE":
-                prog = self.action_timer / self.raise_time
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    self.drop_phase = None
-                    self.set_hoist(self.x, self.y, self.top_y, False)
-
-                    # Now go to right scanner (scanner 1)
-                    if len(self.scanner_list) > 1:
-                        target_x, target_y = self.scanner_list[1].get_drop_zone_position()
-
-                        # STRICT CHECK: Verify path to right scanner is clear
-                        if not self.would_collide_with(blue_crane) and self.can_move_to_x(target_x, blue_crane):
-                            # Safe to proceed to right scanner
-                            self.target_i = 1
-                            self.from_rightmost = True
-                            self.state = "MOVE_TO_SCANNER"
-                            self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                        else:
-                            # Blue crane blocking - go home instead
-                            self.state = "RETURN_HOME"
-                            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                    else:
-                        # No right scanner, return home
-                        self.state = "RETURN_HOME"
-                        self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-
-        elif self.state == "MOVE_TO_BOX":
-            if self.target_box is None or self.target_box >= len(self.box_list):
-                self.state = "RETURN_HOME"
-                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                return
-
-            # Check for collision with blue crane - use priority system
-            if self.should_yield_to(blue_crane):
-                # Blocked by blue crane - reset movement tracking and recalculate time
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Recalculate travel time from current position
-                target_x, target_y = self.box_list[self.target_box].get_position()
+                self.state = CraneState.MOVE_TO_BOX
+                self._post_drop_action = self._post_drop_default()
                 self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                return
-
-            if self.action_timer > 0:
-                target_x, target_y = self.box_list[self.target_box].get_position()
-
-                # Initialize movement tracking on first frame
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-
-                # Prevent division by zero
-                if self._move_total_time > 0:
-                    progress = 1.0 - (self.action_timer / self._move_total_time)
-                    self.x = self._move_start_x + (target_x - self._move_start_x) * progress
-                    self.y = self._move_start_y + (target_y - self._move_start_y) * progress
-                    self.update_position()
-            else:
-                # Movement complete - set final position
-                target_x, target_y = self.box_list[self.target_box].get_position()
-                self.x, self.y = target_x, target_y
-                self.update_position()
+                # Signal to blue crane that we're moving
+                blue_crane.waiting_for_red_to_clear = True
+            return
+
+        # Otherwise just wait at current position - no staging movement needed
+
+    def _step_drop_at_box(self, dt, blue_crane):
+        """DROP_AT_BOX: two-phase drop (LOWER then RAISE) into the target box"""
+        if self.target_box is None or self.target_box >= len(self.box_list):
+            self.state = CraneState.RETURN_HOME
+            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+            return
+
+        # SPECIAL CASE: If we're here with no timer and no phase, we finished dropping
+        # but couldn't move because blue crane was blocking. Retry the transition.
+        if self.action_timer <= 0 and self.drop_phase is None:
+            self._leave_box(blue_crane, retry=True)
+            return
+
+        lift = self._tick_lift(self.drop_phase)
+        if lift == "CONTACT":
+            self.drop_phase = "RAISE"
+            self.has_diamond = False
+            self.set_diamond_visible(False)
+
+            diamond_patch = self.box_list[self.target_box].add_diamond()
+            if self.ax is not None:
+                self.ax.add_patch(diamond_patch)
+
+        elif lift == "DONE":
+            self.drop_phase = None
+            self._leave_box(blue_crane, retry=False)
+
+    def _leave_box(self, blue_crane, retry):
+        """
+        Pick the move that follows a drop, according to _post_drop_action
 
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
+        AFTER_DROP_RIGHT_SCANNER: head for the right scanner (home if blue blocks the way)
+        AFTER_DROP_LEFT_SCANNER: head for the left scanner if it has a diamond, else home
+        AFTER_DROP_HOME: return home once the path is clear
 
-                self.state = "DROP_AT_BOX"
-                self.action_timer = self.lower_time
-                self.drop_phase = "LOWER"
+        Args:
+            blue_crane: The blue crane, for collision checks
+            retry: True when re-trying after an earlier blocked attempt
+        """
+        # Neither crane moves while we decide, so check collision once
+        blocked = self.would_collide_with(blue_crane)
+
+        post_drop_action = self._post_drop_action
+        if post_drop_action == self.AFTER_DROP_RIGHT_SCANNER:
+            # Now go to right scanner (scanner 1)
+            if len(self.scanner_list) > self.RIGHT_SCANNER:
+                target_x, target_y = self._scanner_drop_positions[self.RIGHT_SCANNER]
+
+                # STRICT CHECK: Verify path to right scanner is clear
+                if self._try_go_to(CraneState.MOVE_TO_SCANNER, target_x, target_y, blue_crane, blocked):
+                    # Safe to proceed to right scanner
+                    self.target_i = self.RIGHT_SCANNER
+                    self.from_rightmost = True
+                    return
 
-        elif self.state == "DROP_AT_BOX":
-            if self.target_box is None or self.target_box >= len(self.box_list):
-                self.state = "RETURN_HOME"
-                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                return
+                if retry and blocked:
+                    # Still blocked - wait here (will retry next frame)
+                    return
 
-            # SPECIAL CASE: If we're here with no timer and no phase, we finished dropping
-            # but couldn't move because blue crane was blocking. Retry the transition.
-            if self.action_timer <= 0 and self.drop_phase is None:
-                # After dropping, check what to do next
-                if self.from_rightmost:
-                    # Check if left scanner has a diamond ready
-                    if len(self.scanner_list) > 0:
-                        left_scanner = self.scanner_list[0]
-                        if left_scanner.state in ("ready", "scanning"):
-                            target_x, target_y = left_scanner.get_drop_zone_position()
-
-                            if not self.would_collide_with(blue_crane) and self.can_move_to_x(target_x, blue_crane):
-                                # Now safe to go to left scanner
-                                self.target_i = 0
-                                self.target_box = left_scanner.get_target_box()
-                                self.from_rightmost = False
-                                self.state = "MOVE_TO_SCANNER"
-                                self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                                return
-
-                    # Left scanner not ready or still blocked - try going home
-                    self.from_rightmost = False
-                    if not self.would_collide_with(blue_crane):
-                        self.state = "RETURN_HOME"
-                        self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+            # Blue crane blocking or no right scanner - go home instead
+            self.state = CraneState.RETURN_HOME
+            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+            return
+
+        if post_drop_action == self.AFTER_DROP_LEFT_SCANNER:
+            # Just finished dropping from right scanner
+            # Check if left scanner has a diamond ready or will be ready soon
+            if len(self.scanner_list) > self.LEFT_SCANNER:
+                left_scanner = self.scanner_list[self.LEFT_SCANNER]
+
+                # Go to left scanner if it's ready or scanning
+                if left_scanner.state in ("ready", "scanning"):
+                    # STRICT CHECK: Verify path is clear before committing
+                    target_x, target_y = left_scanner.get_drop_zone_position()
+
+                    if self._try_go_to(CraneState.MOVE_TO_SCANNER, target_x, target_y, blue_crane, blocked):
+                        # Safe to go to left scanner
+                        self.target_i = self.LEFT_SCANNER
+                        self.target_box = left_scanner.get_target_box()
+                        self.from_rightmost = False  # Reset flag
                         return
-                else:
-                    # Try to return home
-                    if not self.would_collide_with(blue_crane):
-                        self.state = "RETURN_HOME"
-                        self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                        return
-
-                # Still blocked - wait here (will retry next frame)
-                return
 
-            if self.drop_phase == "LOWER":
-                prog = 1.0 - (self.action_timer / self.lower_time)
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    self.drop_phase = "RAISE"
-                    self.action_timer = self.raise_time
-                    self.has_diamond = False
-                    self.diamond.set_visible(False)
-
-                    diamond_patch = self.box_list[self.target_box].add_diamond()
-                    self.ax.add_patch(diamond_patch)
-
-            elif self.drop_phase == "RAISE":
-                prog = self.action_timer / self.raise_time
-                z = self.rail_y - (self.rail_y - self.top_y) * prog
-                self.set_hoist(self.x, self.y, z, True)
-
-                if self.action_timer <= 0:
-                    self.drop_phase = None
-                    self.set_hoist(self.x, self.y, self.top_y, False)
-
-                    # After dropping, check what to do next
-                    if self.from_rightmost:
-                        # Just finished dropping from right scanner
-                        # Check if left scanner has a diamond ready or will be ready soon
-                        if len(self.scanner_list) > 0:
-                            left_scanner = self.scanner_list[0]
-
-                            # Go to left scanner if it's ready or scanning
-                            if left_scanner.state in ("ready", "scanning"):
-                                # STRICT CHECK: Verify path is clear before committing
-                                target_x, target_y = left_scanner.get_drop_zone_position()
-
-                                if not self.would_collide_with(blue_crane) and self.can_move_to_x(target_x, blue_crane):
-                                    # Safe to go to left scanner
-                                    self.target_i = 0
-                                    self.target_box = left_scanner.get_target_box()
-                                    self.from_rightmost = False  # Reset flag
-                                    self.state = "MOVE_TO_SCANNER"
-                                    self.action_timer = self.travel_time_2d(self.x, self.y, target_x, target_y)
-                                    return
-
-                        # If left scanner not ready or path blocked, reset flag and go home
-                        self.from_rightmost = False
-
-                        # STRICT CHECK: Only go home if path is clear
-                        if not self.would_collide_with(blue_crane):
-                            self.state = "RETURN_HOME"
-                            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                        # else: stay here until path clears
-                    else:
-                        # Default: return home
-                        # STRICT CHECK: Only go home if path is clear
-                        if not self.would_collide_with(blue_crane):
-                            self.state = "RETURN_HOME"
-                            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                        # else: stay here until path clears
-
-        elif self.state == "RETURN_HOME":
-            if self.should_yield_to(blue_crane):
-                # CRITICAL FIX: Reset movement tracking and recalculate time
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-
-                # Recalculate travel time from current position
-                self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
-                return
+            # If left scanner not ready or path blocked, reset flag and go home
+            self.from_rightmost = False
+            self._post_drop_action = self.AFTER_DROP_HOME
 
-            if self.action_timer > 0:
-                if not hasattr(self, '_move_start_x'):
-                    self._move_start_x = self.x
-                    self._move_start_y = self.y
-                    self._move_total_time = self.action_timer + dt
-
-                progress = 1.0 - (self.action_timer / self._move_total_time)
-                self.x = self._move_start_x + (self.initial_x - self._move_start_x) * progress
-                self.y = self._move_start_y + (self.initial_y - self._move_start_y) * progress
-                self.update_position()
-            else:
-                self.x, self.y = self.initial_x, self.initial_y
-                self.update_position()
-                if hasattr(self, '_move_start_x'):
-                    del self._move_start_x
-                    del self._move_start_y
-                    del self._move_total_time
-                self.state = "WAIT"
-
-        # Update diamond visual if carrying
-        if self.has_diamond:
-            display_x = config.mm_to_display(self.x)
-            display_y = config.mm_to_display(self.top_y)
-            self.diamond.xy = (display_x, display_y)
\ No newline at end of file
+        # Default: return home
+        # STRICT CHECK: Only go home if path is clear
+        if not blocked:
+            self.state = CraneState.RETURN_HOME
+            self.action_timer = self.travel_time_2d(self.x, self.y, self.initial_x, self.initial_y)
+        # else: stay here until path clears (will retry next frame)
@@ -3,6 +3,7 @@
 
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle, Circle, FancyBboxPatch
+from matplotlib.collections import PatchCollection
 from matplotlib.lines import Line2D
 from . import config
 
@@ -162,19 +163,14 @@ class SimulationDisplay:
     def draw_end_boxes(self):
         """Draw all end boxes in the grid"""
         positions = config.get_end_box_positions()
+        r = config.mm_to_display(config.BOX_RADIUS)
+        box_circles = []
         for i, (x_mm, y_mm) in enumerate(positions):
             x = config.mm_to_display(x_mm)
             y = config.mm_to_display(y_mm)
-            r = config.mm_to_display(config.BOX_RADIUS)
 
-            # End box circle
-            box = Circle((x, y), r,
-                         facecolor=config.COLOR_END_BOX,
-                         edgecolor='darkorange',
-                         linewidth=1.5,
-                         alpha=0.8,
-                         zorder=2)
-            self.ax.add_patch(box)
+            # End box circle (drawn below as one collection)
+            box_circles.append(Circle((x, y), r))
 
             # Box number (small text)
             self.ax.text(x, y, str(i+1),
@@ -182,6 +178,13 @@ class SimulationDisplay:
                          fontsize=7, fontweight='bold',
                          color='black')
 
+        self.ax.add_collection(PatchCollection(box_circles,
+                                               facecolor=config.COLOR_END_BOX,
+                                               edgecolor='darkorange',
+                                               linewidth=1.5,
+                                               alpha=0.8,
+                                               zorder=2))
+
         # Label for end boxes region
         center_x = sum(x for x, y in positions) / len(positions)
         max_y = max(y for x, y in positions)
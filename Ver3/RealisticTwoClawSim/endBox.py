@@ -42,6 +42,8 @@ class Box:
         self.box_id = box_id
         self.x_pos = x_pos
         self.y_pos = y_pos
+        # Boxes never move: build the position tuple once for the getters
+        self._position = (x_pos, y_pos)
         self.diamond_count = 0
         self.delivered_diamonds = []  # Visual diamonds in this box
 
@@ -81,7 +83,7 @@ class Box:
 
         Returns: (x, y) tuple
         """
-        return (self.x_pos, self.y_pos)
+        return self._position
 
     def get_coordinates(self):
         """
@@ -89,7 +91,7 @@ class Box:
 
         Returns: (x, y) tuple in mm
         """
-        return (self.x_pos, self.y_pos)
+        return self._position
 
     def get_drop_zone_position(self):
         """
@@ -98,7 +100,7 @@ class Box:
 
         Returns: (x, y) tuple in mm
         """
-        return (self.x_pos, self.y_pos)
+        return self._position
 
     def get_count(self):
         """
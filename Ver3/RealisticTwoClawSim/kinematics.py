@@ -0,0 +1,72 @@
+# Ver3/RealisticTwoClawSim/kinematics.py
+"""
+Pure numeric movement helpers for Ver3 Realistic Two-Claw Simulation
+
+These functions take and return plain floats only (no crane objects, no
+matplotlib), so the per-frame movement math lives in one place.
+"""
+
+import math
+
+
+def advance_linear(start_x, start_y, delta_x, delta_y, time_remaining, inv_total_time):
+    """
+    Linearly interpolate a 2D move from its start point toward its target
+
+    The per-move constants (delta and 1 / duration) are computed once when
+    the move starts, so each frame is multiplies and adds only.
+
+    Args:
+        start_x, start_y: Position where the move started (mm)
+        delta_x, delta_y: Target minus start position (mm)
+        time_remaining: Time left until arrival (s)
+        inv_total_time: 1 / total duration of the move (1/s)
+
+    Returns: (x, y, progress) where progress runs from 0 to 1
+    """
+    progress = 1.0 - time_remaining * inv_total_time
+    x = start_x + delta_x * progress
+    y = start_y + delta_y * progress
+    return x, y, progress
+
+
+def axis_travel_time(distance, v_max, accel):
+    """
+    Time to cover distance on one axis starting from rest (same profile as
+    config.timeToTravel with V_INIT = 0)
+
+    Args:
+        distance: Distance to travel (mm, > 0)
+        v_max: Maximum velocity on this axis (mm/s)
+        accel: Acceleration on this axis (mm/s^2)
+
+    Returns: time in seconds
+    """
+    # Distance needed to reach vmax
+    s_vmax = v_max**2 / (2 * accel)
+    if s_vmax >= distance:
+        # Never reach vmax - solve 0.5*a*t^2 - distance = 0
+        a = 0.5 * accel
+        return math.sqrt(4*a*distance) / (2*a)
+    # Accelerate to vmax, then cruise
+    return v_max / accel + (distance - s_vmax) / v_max
+
+
+def travel_time_2d(x0, y0, x1, y1, vmax_x, a_x, vmax_y, a_y):
+    """
+    Time to travel from (x0, y0) to (x1, y1) with both axes moving at once
+
+    Args:
+        x0, y0: Start position (mm)
+        x1, y1: Destination (mm)
+        vmax_x, a_x: X-axis max velocity (mm/s) and acceleration (mm/s^2)
+        vmax_y, a_y: Y-axis max velocity (mm/s) and acceleration (mm/s^2)
+
+    Returns: time in seconds (the slower of the two axes)
+    """
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    time_x = axis_travel_time(dx, vmax_x, a_x) if dx > 0 else 0.0
+    time_y = axis_travel_time(dy, vmax_y, a_y) if dy > 0 else 0.0
+    return max(time_x, time_y)
+
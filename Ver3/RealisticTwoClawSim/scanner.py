@@ -31,6 +31,16 @@ class DScanner:
     - "ready": Scan complete, diamond ready for pickup
     """
 
+    # Bumped on every state transition of any scanner, so cranes can tell
+    # whether anything changed since they last looked
+    state_changes = 0
+
+    # Fixed attribute layout: scanners are polled by both cranes every frame
+    __slots__ = (
+        'x_pos', 'y_pos', '_position', 'scans_done', 'state', 'ready_time', 'timer',
+        'target_box_id', 'scan_time', 'state_text', 'diamond',
+    )
+
     def __init__(self, x_pos, y_pos):
         """
         Initialize scanner
@@ -41,6 +51,8 @@ class DScanner:
         """
         self.x_pos = x_pos
         self.y_pos = y_pos
+        # Scanners never move: build the position tuple once for the getters
+        self._position = (x_pos, y_pos)
         self.scans_done = 0
         self.state = "empty"  # possible states: empty, scanning, ready
         self.ready_time = None  # when it entered ready state
@@ -57,7 +69,7 @@ class DScanner:
 
     def get_position(self):
         """Get the (x, y) position of this scanner in mm"""
-        return (self.x_pos, self.y_pos)
+        return self._position
 
     def get_drop_zone_position(self):
         """
@@ -66,7 +78,7 @@ class DScanner:
 
         Returns: (x, y) tuple in mm
         """
-        return (self.x_pos, self.y_pos)
+        return self._position
 
     def scan(self, diamond=None):
         """
@@ -80,12 +92,13 @@ class DScanner:
             return
 
         self.state = "scanning"
+        DScanner.state_changes += 1
         self.timer = self.scan_time
         self.diamond.set_visible(True)
         self.diamond.set_facecolor('#ffd54f')  # Yellow during scanning
 
         # Randomly assign a target box
-        self.target_box_id = random.randint(0, config.N_BOXES - 1)
+        self.target_box_id = random.randrange(config.N_BOXES)
 
     def update(self, dt, current_time):
         """
@@ -99,6 +112,7 @@ class DScanner:
             self.timer -= dt
             if self.timer <= 0:
                 self.state = "ready"
+                DScanner.state_changes += 1
                 self.ready_time = current_time
                 self.diamond.set_facecolor('#66bb6a')  # Green when ready
 
@@ -120,6 +134,7 @@ class DScanner:
         box_id = self.target_box_id
 
         self.state = "empty"
+        DScanner.state_changes += 1
         self.ready_time = None
         self.target_box_id = None
         self.diamond.set_visible(False)
@@ -180,6 +195,7 @@ class DScanner:
     def reset(self):
         """Reset scanner to initial empty state"""
         self.state = "empty"
+        DScanner.state_changes += 1
         self.ready_time = None
         self.timer = 0.0
         self.target_box_id = None
@@ -10,6 +10,7 @@ Features:
 
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import PatchCollection
 from matplotlib.patches import Circle, Rectangle
 from matplotlib.widgets import Button, TextBox
 import matplotlib.patches as mpatches
@@ -17,7 +18,7 @@ import matplotlib.patches as mpatches
 from . import config
 from .scanner import DScanner
 from .endBox import Box
-from .crane import BlueCrane, RedCrane
+from .crane import BlueCrane, RedCrane, CraneState
 
 
 class SimulationController:
@@ -144,6 +145,10 @@ class SimulationController:
         progress_milestones = [int(target_time * p / 100) for p in range(5, 100, 5)]
         next_milestone_idx = 0
 
+        # Physics only while fast-forwarding: crane artists are synced once afterwards
+        for crane in self.cranes:
+            crane.visual_enabled = False
+
         try:
             while self.t_elapsed < target_time and step_count < max_steps:
                 # Save state periodically in case we need to recover
@@ -196,6 +201,9 @@ class SimulationController:
             import traceback
             traceback.print_exc()
 
+        for crane in self.cranes:
+            crane.visual_enabled = crane.ax is not None
+
         if step_count >= max_steps:
             print(f"Warning: Skip loop exceeded maximum steps ({max_steps})")
             print(f"Stopped at t={self.t_elapsed:.2f}s")
@@ -251,23 +259,17 @@ class SimulationController:
 
     def cleanup_crane_tracking(self):
         """Clean up any stale movement tracking variables in cranes"""
-        for crane in [self.blue_crane, self.red_crane]:
-            # Remove movement tracking variables
-            if hasattr(crane, '_move_start_x'):
-                del crane._move_start_x
-            if hasattr(crane, '_move_start_y'):
-                del crane._move_start_y
-            if hasattr(crane, '_move_total_time'):
-                del crane._move_total_time
+        for crane in self.cranes:
+            # Invalidate movement tracking so the next move starts fresh
+            crane._move_active = False
+            crane._target_state = None
 
             # Ensure visual position matches logical position
-            crane.update_position()
+            crane.update_position(force=True)
 
             # Update diamond position if carrying
             if crane.has_diamond:
-                display_x = config.mm_to_display(crane.x)
-                display_y = config.mm_to_display(crane.top_y)
-                crane.diamond.xy = (display_x, display_y)
+                crane.update_carried_diamond(force=True)
 
     def cleanup_after_skip(self):
         """Comprehensive cleanup after skip operation"""
@@ -275,16 +277,16 @@ class SimulationController:
         self.cleanup_crane_tracking()
 
         # Validate crane states
-        for crane in [self.blue_crane, self.red_crane]:
+        for crane in self.cranes:
             # If crane is in a movement state but has no timer, fix it
-            if crane.state in ["MOVE_TO_SCANNER", "MOVE_TO_BOX", "RETURN_HOME",
-                               "MOVE_TO_START", "RETURN_TO_START", "MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP",
-                               "MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD", "MOVE_TO_BOX_THEN_RIGHT_SCANNER",
-                               "MOVE_TO_HOME_EMPTY"]:
+            if crane.state in [CraneState.MOVE_TO_SCANNER, CraneState.MOVE_TO_BOX, CraneState.RETURN_HOME,
+                               CraneState.MOVE_TO_START, CraneState.RETURN_TO_START, CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_PICKUP,
+                               CraneState.MOVE_OUT_OF_WAY_AFTER_RIGHT_LOAD,
+                               CraneState.MOVE_TO_HOME_EMPTY]:
                 if crane.action_timer <= 0:
                     # Timer expired but state not updated - force to WAIT
                     print(f"Warning: {crane.color} crane in movement state with no timer, forcing to WAIT")
-                    crane.state = "WAIT"
+                    crane.state = CraneState.WAIT
                     crane.action_timer = 0.0
 
             # Clear any pick/drop phases that might be stuck
@@ -296,7 +298,7 @@ class SimulationController:
 
             # CRITICAL: Validate crane position matches its state
             # This prevents cranes from being in wrong locations after skip
-            if crane.state == "WAIT":
+            if crane.state == CraneState.WAIT:
                 # WAIT state should be at home position
                 expected_x = crane.initial_x
                 expected_y = crane.initial_y
@@ -305,19 +307,18 @@ class SimulationController:
                     print(f"Warning: {crane.color} crane in WAIT but not at home (at {crane.x:.1f}, {crane.y:.1f}, expected {expected_x:.1f}, {expected_y:.1f})")
                     # Don't force move - might be valid intermediate state
 
-            elif crane.state in ["PICK_AT_START", "DROP_AT_SCANNER", "PICK_AT_SCANNER",
-                                 "DROP_AT_BOX", "DROP_AT_BOX_THEN_RIGHT_SCANNER", "LOWER_FOR_PICKUP"]:
+            elif crane.state in [CraneState.PICK_AT_START, CraneState.DROP_AT_SCANNER, CraneState.PICK_AT_SCANNER,
+                                 CraneState.DROP_AT_BOX, CraneState.LOWER_FOR_PICKUP]:
                 # These states should have a target position
                 # Validate that crane is approximately at the target
-                if crane.state == "PICK_AT_START":
-                    pickup_x, pickup_y = config.get_pickup_position()
-                    expected_x, expected_y = pickup_x, pickup_y
-                elif crane.state in ["DROP_AT_SCANNER", "PICK_AT_SCANNER", "LOWER_FOR_PICKUP"]:
+                if crane.state == CraneState.PICK_AT_START:
+                    expected_x, expected_y = crane._pickup_x, crane._pickup_y
+                elif crane.state in [CraneState.DROP_AT_SCANNER, CraneState.PICK_AT_SCANNER, CraneState.LOWER_FOR_PICKUP]:
                     if crane.target_i is not None and crane.target_i < len(crane.scanner_list):
                         expected_x, expected_y = crane.scanner_list[crane.target_i].get_drop_zone_position()
                     else:
                         continue  # Can't validate without target
-                elif crane.state in ["DROP_AT_BOX", "DROP_AT_BOX_THEN_RIGHT_SCANNER"]:
+                elif crane.state == CraneState.DROP_AT_BOX:
                     if hasattr(crane, 'target_box') and crane.target_box is not None and crane.target_box < len(crane.box_list):
                         expected_x, expected_y = crane.box_list[crane.target_box].get_position()
                     else:
@@ -327,7 +328,7 @@ class SimulationController:
 
                 distance = abs(crane.x - expected_x) + abs(crane.y - expected_y)
                 if distance > 50:  # More than 50mm away
-                    print(f"Warning: {crane.color} crane in {crane.state} but not at target position")
+                    print(f"Warning: {crane.color} crane in {crane.state.name} but not at target position")
                     print(f"  Current: ({crane.x:.1f}, {crane.y:.1f})")
                     print(f"  Expected: ({expected_x:.1f}, {expected_y:.1f})")
                     print(f"  Distance: {distance:.1f}mm")
@@ -344,8 +345,8 @@ class SimulationController:
         if distance_between_cranes < safe_distance:
             print(f"\n{'!'*70}")
             print(f"ERROR: Collision violation detected after skip!")
-            print(f"  Blue crane X: {self.blue_crane.x:.1f}mm, State: {self.blue_crane.state}")
-            print(f"  Red crane X:  {self.red_crane.x:.1f}mm, State: {self.red_crane.state}")
+            print(f"  Blue crane X: {self.blue_crane.x:.1f}mm, State: {self.blue_crane.state.name}")
+            print(f"  Red crane X:  {self.red_crane.x:.1f}mm, State: {self.red_crane.state.name}")
             print(f"  Distance:     {distance_between_cranes:.1f}mm")
             print(f"  Safe dist:    {safe_distance:.1f}mm")
             print(f"  Violation:    {safe_distance - distance_between_cranes:.1f}mm")
@@ -354,45 +355,45 @@ class SimulationController:
 
             # Determine which crane to move based on state
             # If one is in a critical state (picking/dropping), move the other one
-            blue_critical = self.blue_crane.state in ["PICK_AT_START", "DROP_AT_SCANNER", "PICK_AT_SCANNER"]
-            red_critical = self.red_crane.state in ["PICK_AT_SCANNER", "DROP_AT_BOX", "LOWER_FOR_PICKUP"]
+            blue_critical = self.blue_crane.state in [CraneState.PICK_AT_START, CraneState.DROP_AT_SCANNER, CraneState.PICK_AT_SCANNER]
+            red_critical = self.red_crane.state in [CraneState.PICK_AT_SCANNER, CraneState.DROP_AT_BOX, CraneState.LOWER_FOR_PICKUP]
 
             if blue_critical and not red_critical:
                 # Move red crane to home
                 self.red_crane.x = config.RED_CRANE_HOME_X
                 self.red_crane.y = config.RED_CRANE_HOME_Y
-                self.red_crane.state = "WAIT"
+                self.red_crane.state = CraneState.WAIT
                 self.red_crane.action_timer = 0.0
                 self.red_crane.has_diamond = False
-                self.red_crane.diamond.set_visible(False)
+                self.red_crane.set_diamond_visible(False)
                 self.red_crane.update_position()
                 print(f"Moved red crane to home")
             elif red_critical and not blue_critical:
                 # Move blue crane to home
                 self.blue_crane.x = config.BLUE_CRANE_HOME_X
                 self.blue_crane.y = config.BLUE_CRANE_HOME_Y
-                self.blue_crane.state = "WAIT"
+                self.blue_crane.state = CraneState.WAIT
                 self.blue_crane.action_timer = 0.0
                 self.blue_crane.has_diamond = False
-                self.blue_crane.diamond.set_visible(False)
+                self.blue_crane.set_diamond_visible(False)
                 self.blue_crane.update_position()
                 print(f"Moved blue crane to home")
             else:
                 # Both or neither critical - move both to home
                 self.blue_crane.x = config.BLUE_CRANE_HOME_X
                 self.blue_crane.y = config.BLUE_CRANE_HOME_Y
-                self.blue_crane.state = "WAIT"
+                self.blue_crane.state = CraneState.WAIT
                 self.blue_crane.action_timer = 0.0
                 self.blue_crane.has_diamond = False
-                self.blue_crane.diamond.set_visible(False)
+                self.blue_crane.set_diamond_visible(False)
                 self.blue_crane.update_position()
 
                 self.red_crane.x = config.RED_CRANE_HOME_X
                 self.red_crane.y = config.RED_CRANE_HOME_Y
-                self.red_crane.state = "WAIT"
+                self.red_crane.state = CraneState.WAIT
                 self.red_crane.action_timer = 0.0
                 self.red_crane.has_diamond = False
-                self.red_crane.diamond.set_visible(False)
+                self.red_crane.set_diamond_visible(False)
                 self.red_crane.update_position()
                 print(f"Moved both cranes to home positions")
 
@@ -517,23 +518,25 @@ class SimulationController:
     def draw_end_boxes(self):
         """Draw end boxes"""
         positions = config.get_end_box_positions()
+        r = config.mm_to_display(config.BOX_RADIUS)
+        box_circles = []
         for i, (x_mm, y_mm) in enumerate(positions):
             x = config.mm_to_display(x_mm)
             y = config.mm_to_display(y_mm)
-            r = config.mm_to_display(config.BOX_RADIUS)
-
-            box_circle = Circle((x, y), r,
-                                facecolor=config.COLOR_END_BOX,
-                                edgecolor='darkorange',
-                                linewidth=1.5,
-                                alpha=0.6,
-                                zorder=2)
-            self.ax.add_patch(box_circle)
+            box_circles.append(Circle((x, y), r))
 
             self.ax.text(x, y, str(i+1),
                          ha='center', va='center',
                          fontsize=8, fontweight='bold')
 
+        # One collection for all boxes: a single draw call per frame
+        self.ax.add_collection(PatchCollection(box_circles,
+                                               facecolor=config.COLOR_END_BOX,
+                                               edgecolor='darkorange',
+                                               linewidth=1.5,
+                                               alpha=0.6,
+                                               zorder=2))
+
     def add_legend(self):
         """Add legend"""
         from matplotlib.lines import Line2D
@@ -570,6 +573,8 @@ class SimulationController:
         """Create crane objects"""
         self.blue_crane = BlueCrane(self.ax, self.scanner_list)
         self.red_crane = RedCrane(self.ax, self.scanner_list, self.box_list)
+        # Fixed update order (blue first, then red) shared by every per-crane loop
+        self.cranes = (self.blue_crane, self.red_crane)
 
     def get_scanner_color(self, state):
         """Get color for scanner based on its state"""
@@ -713,6 +718,15 @@ class SimulationController:
         w = config.mm_to_display(config.CRANE_WIDTH)
         h = config.mm_to_display(config.CRANE_HEIGHT)
 
+        # mm_to_display is a pure scale: keep the factor and the constant
+        # half-sizes so update_side_view is multiplies only
+        self._side_scale = config.mm_to_display(1.0)
+        self._side_half_w = w / 2
+        self._side_half_h = h / 2
+
+        # Crane/hand positions drawn by the last update_side_view (None = never drawn)
+        self._side_last_drawn = None
+
         # Blue crane elements
         blue_x = config.mm_to_display(self.blue_crane.x)
         blue_z = config.mm_to_display(self.blue_crane.z)
@@ -766,18 +780,28 @@ class SimulationController:
         if self.ax_side is None:
             return
 
-        w = config.mm_to_display(config.CRANE_WIDTH)
-        h = config.mm_to_display(config.CRANE_HEIGHT)
+        # Calculate hand positions
+        blue_hand_z = self.get_crane_hand_z(self.blue_crane)
+        red_hand_z = self.get_crane_hand_z(self.red_crane)
+
+        # Skip the artist updates when nothing shown in this view has moved
+        drawn_state = (self.blue_crane.x, self.blue_crane.z, blue_hand_z, self.blue_crane.has_diamond,
+                       self.red_crane.x, self.red_crane.z, red_hand_z, self.red_crane.has_diamond)
+        if drawn_state == self._side_last_drawn:
+            return
+        self._side_last_drawn = drawn_state
+
+        scale = self._side_scale
+        half_w = self._side_half_w
+        half_h = self._side_half_h
 
         # Update blue crane
-        blue_x = config.mm_to_display(self.blue_crane.x)
-        blue_z_crane = config.mm_to_display(self.blue_crane.z)
+        blue_x = self.blue_crane.x * scale
+        blue_z_crane = self.blue_crane.z * scale
 
-        self.side_blue_crane_rect.set_xy((blue_x - w/2, blue_z_crane - h/2))
+        self.side_blue_crane_rect.set_xy((blue_x - half_w, blue_z_crane - half_h))
 
-        # Calculate hand position
-        blue_hand_z = self.get_crane_hand_z(self.blue_crane)
-        blue_hand_z_display = config.mm_to_display(blue_hand_z)
+        blue_hand_z_display = blue_hand_z * scale
 
         # Update hoist line
         if blue_hand_z < self.blue_crane.z - 10:
@@ -798,14 +822,12 @@ class SimulationController:
             self.side_blue_diamond.set_visible(False)
 
         # Update red crane
-        red_x = config.mm_to_display(self.red_crane.x)
-        red_z_crane = config.mm_to_display(self.red_crane.z)
+        red_x = self.red_crane.x * scale
+        red_z_crane = self.red_crane.z * scale
 
-        self.side_red_crane_rect.set_xy((red_x - w/2, red_z_crane - h/2))
+        self.side_red_crane_rect.set_xy((red_x - half_w, red_z_crane - half_h))
 
-        # Calculate hand position
-        red_hand_z = self.get_crane_hand_z(self.red_crane)
-        red_hand_z_display = config.mm_to_display(red_hand_z)
+        red_hand_z_display = red_hand_z * scale
 
         # Update hoist line
         if red_hand_z < self.red_crane.z - 10:
@@ -959,8 +981,20 @@ class SimulationController:
         self.is_paused = not self.is_paused
         self.pause_button.label.set_text('Resume' if self.is_paused else 'Pause')
 
-    def step_simulation(self, dt, skip_mode=False):
-        """Execute one simulation time step"""
+    def step_simulation(self, dt, skip_mode=False, render=True):
+        """
+        Execute one simulation time step
+
+        Args:
+            dt: Time step (s)
+            skip_mode: Fast-forward step (no speed multiplier, clock always runs,
+                       no display refresh)
+            render: Refresh labels, metrics and the side view (normal-mode time
+                    handling is unaffected)
+        """
+        # Display refresh happens on rendered normal-mode steps only
+        refresh = render and not skip_mode
+
         # CRITICAL: Don't apply speed multiplier during skip mode
         # Speed multiplier is for visual playback speed only
         # During skip, we need consistent physics timestep to prevent collisions
@@ -969,7 +1003,7 @@ class SimulationController:
 
         # Check if simulation should start (blue crane starts picking up first diamond)
         if not self.simulation_started:
-            if (self.blue_crane.state == "PICK_AT_START" and
+            if (self.blue_crane.state == CraneState.PICK_AT_START and
                     self.blue_crane.pick_phase == "LOWER"):
                 # Blue crane is lowering to pick up first diamond - start timer!
                 self.simulation_started = True
@@ -977,7 +1011,7 @@ class SimulationController:
         # Update scanners
         for scanner in self.scanner_list:
             scanner.update(dt, self.t_elapsed)
-            if not skip_mode:  # Skip label updates during fast-forward
+            if refresh:  # Skip label updates during fast-forward
                 scanner.update_state_label()
 
         # Track Total Ready Wait (TRW) time - time diamonds spend waiting in "ready" state
@@ -989,12 +1023,13 @@ class SimulationController:
                     self.total_ready_wait_time += dt
 
         # Update cranes
-        self.blue_crane.step(dt, self.blue_crane, self.red_crane)
-        self.red_crane.step(dt, self.blue_crane, self.red_crane)
+        blue_crane, red_crane = self.cranes
+        for crane in self.cranes:
+            crane.step(dt, blue_crane, red_crane)
 
         # Track when red crane delivers diamonds
         # We check if red crane just completed a drop
-        if self.red_crane.state == "RETURN_HOME" and self.red_crane.action_timer > 0:
+        if self.red_crane.state == CraneState.RETURN_HOME and self.red_crane.action_timer > 0:
             # Just finished dropping, count was already incremented in crane
             pass
 
@@ -1020,12 +1055,12 @@ class SimulationController:
                 self.t_elapsed += dt
 
         # Update metrics display (skip during fast-forward for performance)
-        if not skip_mode:
+        if refresh:
             self.update_metrics_display()
             self.update_scanner_colors()  # Update scanner colors based on state
 
         # Update side view if enabled (skip during fast-forward for performance)
-        if self.enable_side_view and not skip_mode:
+        if self.enable_side_view and refresh:
             try:
                 self.update_side_view()
             except Exception as e:
@@ -1038,7 +1073,19 @@ class SimulationController:
     def animation_update(self, frame):
         """Animation update function called by FuncAnimation"""
         if not self.is_paused:
-            self.step_simulation(config.DT, skip_mode=False)
+            extra_steps = config.DISP_SKIP - 1
+            if extra_steps > 0:
+                # Physics only for the intermediate steps: crane artists are
+                # synced once before the rendered step
+                for crane in self.cranes:
+                    crane.visual_enabled = False
+                for _ in range(extra_steps):
+                    self.step_simulation(config.DT, render=False)
+                for crane in self.cranes:
+                    crane.visual_enabled = crane.ax is not None
+                    crane.update_position(force=True)
+                    crane.update_carried_diamond(force=True)
+            self.step_simulation(config.DT)
         return []
 
     def run(self):
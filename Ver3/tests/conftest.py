@@ -0,0 +1,10 @@
+# Ver3/tests/conftest.py
+"""
+Shared pytest setup for Ver3 tests
+
+Runs matplotlib headless; Ver3/pytest.ini puts Ver3/ on the import path.
+"""
+
+import matplotlib
+
+matplotlib.use("Agg")
@@ -0,0 +1,64 @@
+# Ver3/tests/test_disp_skip.py
+"""
+Tests for config.DISP_SKIP (several physics steps per rendered frame)
+
+Advancing the same amount of simulated time must give the same clock,
+counters and crane positions whether every step is rendered or not.
+"""
+
+import random
+
+import matplotlib.pyplot as plt
+import pytest
+
+from RealisticTwoClawSim import config
+from RealisticTwoClawSim.simulation import SimulationController
+
+TOTAL_STEPS = 1200  # 20 s of simulated time at 60 FPS
+
+
+def run_frames(disp_skip, monkeypatch, enable_side_view=False):
+    """Run TOTAL_STEPS physics steps through animation_update and return a snapshot"""
+    monkeypatch.setattr(config, "DISP_SKIP", disp_skip)
+    random.seed(1234)
+    controller = SimulationController(enable_side_view=enable_side_view)
+    try:
+        for frame in range(TOTAL_STEPS // disp_skip):
+            controller.animation_update(frame)
+        return {
+            "t_elapsed": controller.t_elapsed,
+            "simulation_started": controller.simulation_started,
+            "diamonds_delivered": controller.diamonds_delivered,
+            "diamonds_scanned": controller.diamonds_scanned,
+            "total_ready_wait_time": controller.total_ready_wait_time,
+            "cranes": [(crane.x, crane.y, crane.state, crane.has_diamond)
+                       for crane in controller.cranes],
+            "visual_enabled": [crane.visual_enabled for crane in controller.cranes],
+            "crane_rects": [tuple(crane.crane_rect.get_xy()) for crane in controller.cranes],
+        }
+    finally:
+        plt.close("all")
+
+
+@pytest.mark.parametrize("disp_skip", [2, 5, 12])
+def test_disp_skip_matches_single_stepping(disp_skip, monkeypatch):
+    """Clock, counters and crane state match DISP_SKIP=1 over the same simulated time"""
+    single = run_frames(1, monkeypatch)
+    batched = run_frames(disp_skip, monkeypatch)
+
+    for key in ("t_elapsed", "simulation_started", "diamonds_delivered",
+                "diamonds_scanned", "total_ready_wait_time", "cranes"):
+        assert batched[key] == single[key], key
+
+
+def test_disp_skip_restores_crane_artists(monkeypatch):
+    """Crane artists are re-enabled and synced to the crane positions after each frame"""
+    batched = run_frames(5, monkeypatch, enable_side_view=True)
+
+    assert all(batched["visual_enabled"])
+    scale = config.mm_to_display(1.0)
+    for (x, y, _, _), (rect_x, rect_y) in zip(batched["cranes"], batched["crane_rects"]):
+        half_w = config.mm_to_display(config.CRANE_WIDTH) / 2
+        half_h = config.mm_to_display(config.CRANE_HEIGHT) / 2
+        assert abs(rect_x - (x * scale - half_w)) <= config.mm_to_display(config.REDRAW_THRESHOLD_MM)
+        assert abs(rect_y - (y * scale - half_h)) <= config.mm_to_display(config.REDRAW_THRESHOLD_MM)
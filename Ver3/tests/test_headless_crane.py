@@ -0,0 +1,65 @@
+# Ver3/tests/test_headless_crane.py
+"""
+Tests for cranes built headless (ax=None)
+"""
+
+import random
+
+import matplotlib.pyplot as plt
+
+from RealisticTwoClawSim import config
+from RealisticTwoClawSim.crane import BlueCrane, RedCrane
+from RealisticTwoClawSim.endBox import Box
+from RealisticTwoClawSim.scanner import DScanner
+from RealisticTwoClawSim.simulation import SimulationController
+
+STEPS = 3000
+
+
+def make_headless_cranes():
+    """Blue and red cranes with real scanners and boxes but no axes"""
+    scanner_list = [DScanner(x, y) for x, y in config.get_scanner_positions()]
+    box_list = [Box(i, x, y) for i, (x, y) in enumerate(config.get_end_box_positions())]
+    blue_crane = BlueCrane(None, scanner_list)
+    red_crane = RedCrane(None, scanner_list, box_list)
+    return blue_crane, red_crane, scanner_list
+
+
+def test_headless_cranes_build_no_artists():
+    """No crane rectangle, carried diamond or start diamond is created"""
+    blue_crane, red_crane, _ = make_headless_cranes()
+
+    for crane in (blue_crane, red_crane):
+        assert not crane.visual_enabled
+        assert crane.crane_rect is None
+        assert crane.diamond is None
+    assert blue_crane.start_diamond is None
+
+
+def test_headless_cranes_follow_the_drawn_trajectory():
+    """Stepping headless cranes gives the same path as the full controller"""
+    random.seed(99)
+    blue_crane, red_crane, scanner_list = make_headless_cranes()
+    headless = []
+    t_elapsed = 0.0
+    for _ in range(STEPS):
+        for scanner in scanner_list:
+            scanner.update(config.DT, t_elapsed)
+        for crane in (blue_crane, red_crane):
+            crane.step(config.DT, blue_crane, red_crane)
+        headless.append((blue_crane.x, blue_crane.y, blue_crane.state, blue_crane.has_diamond,
+                         red_crane.x, red_crane.y, red_crane.state, red_crane.has_diamond))
+
+    random.seed(99)
+    controller = SimulationController(enable_side_view=False)
+    drawn = []
+    try:
+        for _ in range(STEPS):
+            controller.step_simulation(config.DT, skip_mode=True)
+            blue, red = controller.blue_crane, controller.red_crane
+            drawn.append((blue.x, blue.y, blue.state, blue.has_diamond,
+                          red.x, red.y, red.state, red.has_diamond))
+    finally:
+        plt.close("all")
+
+    assert headless == drawn
@@ -0,0 +1,38 @@
+# Ver3/tests/test_kinematics.py
+"""
+Tests for the float-only movement helpers in kinematics.py
+"""
+
+import random
+
+from RealisticTwoClawSim import config, kinematics
+
+
+def claw_travel_time(x0, y0, x1, y1):
+    """kinematics.travel_time_2d with the claw limits config uses"""
+    return kinematics.travel_time_2d(x0, y0, x1, y1,
+                                     config.VMAX_CLAW_X, config.A_CLAW_X,
+                                     config.VMAX_CLAW_Y, config.A_CLAW_Y)
+
+
+def test_travel_time_2d_matches_config():
+    """Same result as config.calculate_2d_travel_time, bit for bit"""
+    rng = random.Random(2024)
+    for _ in range(20000):
+        x0, x1 = rng.uniform(-600, 600), rng.uniform(-600, 600)
+        y0, y1 = rng.uniform(-100, 300), rng.uniform(-100, 300)
+        assert claw_travel_time(x0, y0, x1, y1) == config.calculate_2d_travel_time(x0, y0, x1, y1)
+
+
+def test_travel_time_2d_short_and_zero_moves():
+    """Zero moves take no time; moves too short to reach vmax still agree with config"""
+    assert claw_travel_time(10.0, 20.0, 10.0, 20.0) == 0.0
+    for distance in (0.001, 0.5, 5.0, 50.0):
+        assert claw_travel_time(0.0, 0.0, distance, 0.0) == config.calculate_2d_travel_time(0.0, 0.0, distance, 0.0)
+        assert claw_travel_time(0.0, 0.0, 0.0, distance) == config.calculate_2d_travel_time(0.0, 0.0, 0.0, distance)
+
+
+def test_advance_linear_endpoints():
+    """Progress 0 is the start point, progress 1 is the target"""
+    assert kinematics.advance_linear(1.0, 2.0, 10.0, -4.0, 2.0, 0.5) == (1.0, 2.0, 0.0)
+    assert kinematics.advance_linear(1.0, 2.0, 10.0, -4.0, 0.0, 0.5) == (11.0, -2.0, 1.0)
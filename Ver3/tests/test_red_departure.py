@@ -0,0 +1,51 @@
+# Ver3/tests/test_red_departure.py
+"""
+Tests for red's predictive departure scheduling in RedCrane._step_wait
+"""
+
+import pytest
+
+from RealisticTwoClawSim import config
+from RealisticTwoClawSim.crane import BlueCrane, CraneState, RedCrane
+from RealisticTwoClawSim.endBox import Box
+from RealisticTwoClawSim.scanner import DScanner
+
+MAX_STEPS = 2000
+
+
+@pytest.mark.parametrize("scanner_index", [RedCrane.LEFT_SCANNER, RedCrane.RIGHT_SCANNER])
+def test_departure_tick_matches_per_frame_prediction(scanner_index):
+    """The prediction frozen at first sight departs on the same tick as recomputing it every frame"""
+    scanner_list = [DScanner(x, y) for x, y in config.get_scanner_positions()]
+    box_list = [Box(i, x, y) for i, (x, y) in enumerate(config.get_end_box_positions())]
+    blue_crane = BlueCrane(None, scanner_list)
+    red_crane = RedCrane(None, scanner_list, box_list)
+    # Park blue far left so it never blocks red
+    blue_crane.x = -1000.0
+    blue_crane.y = 0.0
+    assert red_crane.state == CraneState.WAIT
+
+    scanner = scanner_list[scanner_index]
+    scanner.scan()
+    scanner_x, scanner_y = red_crane._scanner_drop_positions[scanner_index]
+
+    expected_tick = None
+    departed_tick = None
+    for tick in range(MAX_STEPS):
+        scanner.update(config.DT, red_crane.t_elapsed)
+        # What _step_wait would see if it re-predicted on this frame
+        current_time = red_crane.t_elapsed + config.DT
+        predicted = (current_time + scanner.timer
+                     - red_crane.travel_time_2d(red_crane.x, red_crane.y, scanner_x, scanner_y)
+                     - red_crane.lower_time)
+        if expected_tick is None and current_time >= predicted:
+            expected_tick = tick
+
+        red_crane.step(config.DT, blue_crane, red_crane)
+        if red_crane.state == CraneState.MOVE_TO_SCANNER:
+            departed_tick = tick
+            break
+
+    assert expected_tick is not None
+    assert departed_tick == expected_tick
+    assert red_crane.target_i == scanner_index
@@ -0,0 +1,62 @@
+# Ver3/tests/test_red_right_scanner_route.py
+"""
+Regression test for red's "via the right scanner" route
+
+After picking at the left scanner while the right scanner is busy, red
+drops at the box chosen for that trip (MOVE_TO_BOX, DROP_AT_BOX) and then
+heads straight for the right scanner instead of going home.
+"""
+
+import random
+
+from RealisticTwoClawSim import config
+from RealisticTwoClawSim.crane import BlueCrane, CraneState, RedCrane
+from RealisticTwoClawSim.endBox import Box
+from RealisticTwoClawSim.scanner import DScanner
+
+MAX_STEPS = 5000
+
+
+def test_left_pickup_drops_at_box_then_goes_to_right_scanner():
+    """Seeded run: box run with AFTER_DROP_RIGHT_SCANNER ends at the right scanner"""
+    random.seed(4321)
+    scanner_list = [DScanner(x, y) for x, y in config.get_scanner_positions()]
+    box_list = [Box(i, x, y) for i, (x, y) in enumerate(config.get_end_box_positions())]
+    blue_crane = BlueCrane(None, scanner_list)
+    red_crane = RedCrane(None, scanner_list, box_list)
+    # Park blue far left so it never blocks red
+    blue_crane.x = -1000.0
+    blue_crane.y = 0.0
+
+    left_scanner = scanner_list[RedCrane.LEFT_SCANNER]
+    right_scanner = scanner_list[RedCrane.RIGHT_SCANNER]
+    left_scanner.scan()
+
+    states = []
+    box_for_trip = None
+    t_elapsed = 0.0
+    for _ in range(MAX_STEPS):
+        for scanner in scanner_list:
+            scanner.update(config.DT, t_elapsed)
+        t_elapsed += config.DT
+        # Keep the right scanner busy once red is picking at the left one
+        if red_crane.state == CraneState.PICK_AT_SCANNER and right_scanner.state == "empty":
+            right_scanner.scan()
+
+        red_crane.step(config.DT, blue_crane, red_crane)
+        if not states or states[-1] != red_crane.state:
+            states.append(red_crane.state)
+        if red_crane.state == CraneState.MOVE_TO_BOX and box_for_trip is None:
+            assert red_crane._post_drop_action == RedCrane.AFTER_DROP_RIGHT_SCANNER
+            box_for_trip = red_crane.target_box
+        if box_for_trip is not None and red_crane.state == CraneState.MOVE_TO_SCANNER:
+            break
+
+    assert states[-4:] == [CraneState.PICK_AT_SCANNER, CraneState.MOVE_TO_BOX,
+                           CraneState.DROP_AT_BOX, CraneState.MOVE_TO_SCANNER]
+    assert box_for_trip == right_scanner.target_box_id
+    assert [box.get_count() for box in box_list] == [
+        1 if i == box_for_trip else 0 for i in range(len(box_list))]
+    assert red_crane.target_i == RedCrane.RIGHT_SCANNER
+    assert red_crane.from_rightmost
+    assert not red_crane.has_diamond